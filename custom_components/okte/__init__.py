@@ -10,6 +10,7 @@ import logging
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 import homeassistant.helpers.config_validation as cv
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.template import Template
@@ -347,10 +348,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         master_instance.SENSOR_ENTITY_LAST_UPDATE,
                     ]
                     
-                    async def async_state_changed(event):
+                    @callback
+                    def async_state_changed(event):
                         """React to state changes with debounce."""
-                        LOGGER.debug("OKTE Calculation: Master device data updated, recalculating windows")
-                        await instance.my_controller()
+                        LOGGER.debug("OKTE Calculation: Master device data updated, scheduling window recalculation")
+                        # Burst of master updates (e.g. repeated fetches after midnight) results in one calculation
+                        instance.schedule_calculation(DEBOUNCE_DELAY)
                     
                     entry.async_on_unload(
                         async_track_state_change_event(
@@ -360,92 +363,114 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         )
                     )
             
-            # Setup 15-minute time tracker for precise detector updates
-            # This ensures detectors update exactly at the start of each 15-minute period
-            entry.async_on_unload(
-                async_track_time_change(
-                    hass,
-                    async_run_my_controller,
-                    minute=[0, 15, 30, 45],
-                    second=0
-                )
-            )
-            LOGGER.info("Scheduled detector updates every 15 minutes (:00, :15, :30, :45)")
+            # Detector updates are scheduled by the instance exactly at window start/end
+            entry.async_on_unload(instance.cancel_transition_timer)
+        
+        # Cached timezone (Master and Calculator) is refreshed when user changes Home Assistant's timezone
+        @callback
+        def is_time_zone_update(event_data):
+            """Pass only core config updates which change the timezone."""
+            return "time_zone" in event_data
+        
+        entry.async_on_unload(
+            hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, instance.reset_timezone, event_filter=is_time_zone_update)
+        )
+        
+        # Listen for device registry changes once per device - entities are refreshed via dispatcher
+        from homeassistant.helpers import device_registry as dr, entity_registry as er
+        from .sensor import _load_translations
+        
+        our_device_id = None
+        
+        @callback
+        def is_our_device_event(event_data):
+            """Pass only registry events for our device - other devices don't wake the handler."""
+            nonlocal our_device_id
+            if our_device_id is None:
+                device_entry = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+                if device_entry is None:
+                    return False
+                our_device_id = device_entry.id
+            return event_data.get("device_id") == our_device_id
+        
+        @callback
+        def device_registry_updated(event):
+            """Handle device registry update - refresh entities and update entity names when device name changes."""
+            # Check if this is our device
+            device_id = event.data.get("device_id")
+            if not device_id:
+                return
             
-            # Listen for device name changes and update entity names directly in Entity Registry
-            from homeassistant.helpers import device_registry as dr, entity_registry as er
-            from .sensor import _load_translations
+            device_registry = dr.async_get(hass)
+            device_entry = device_registry.async_get(device_id)
+            if not device_entry or (DOMAIN, entry.entry_id) not in device_entry.identifiers:
+                return
             
-            @callback
-            def device_registry_updated(event):
-                """Handle device registry update - update entity names when device name changes."""
-                if event.data.get("action") != "update":
-                    return
-                
-                # Check if this is our device
-                device_id = event.data.get("device_id")
-                if not device_id:
-                    return
-                
-                changes = event.data.get("changes", {})
-                if "name_by_user" not in changes:
-                    return
-                    
-                device_registry = dr.async_get(hass)
-                device_entry = device_registry.async_get(device_id)
-                
-                if device_entry and (DOMAIN, entry.entry_id) in device_entry.identifiers:
-                    # Our device was updated
-                    new_device_name = device_entry.name_by_user or device_entry.name
+            # Refresh entity states so names from @property are updated
+            async_dispatcher_send(hass, f"{DOMAIN}_device_update_{entry.entry_id}")
+            
+            # Calculator: update entity names directly in Entity Registry when device name changes
+            if device_type != DEVICE_TYPE_CALCULATOR or not master_device:
+                return
+            
+            if event.data.get("action") != "update":
+                return
+            
+            changes = event.data.get("changes", {})
+            if "name_by_user" not in changes:
+                return
+            
+            # Our device was updated
+            new_device_name = device_entry.name_by_user or device_entry.name
+            
+            LOGGER.info(f"Device name changed to '{new_device_name}' for {entry.entry_id}, updating entity names")
+            
+            # Get current value of checkbox from hass.data (updated on reload)
+            current_include_device_name = hass.data[DOMAIN][entry.entry_id].get(CONF_INCLUDE_DEVICE_NAME_IN_ENTITY, DEFAULT_INCLUDE_DEVICE_NAME_IN_ENTITY)
+            
+            # Only update if checkbox is enabled
+            if current_include_device_name:
+                # Schedule async update
+                async def update_entity_names():
+                    # Load translations
+                    translations = await _load_translations(hass)
                     
-                    LOGGER.info(f"Device name changed to '{new_device_name}' for {entry.entry_id}, updating entity names")
+                    # Get entity registry
+                    entity_registry = er.async_get(hass)
                     
-                    # Get current value of checkbox from hass.data (updated on reload)
-                    current_include_device_name = hass.data[DOMAIN][entry.entry_id].get(CONF_INCLUDE_DEVICE_NAME_IN_ENTITY, DEFAULT_INCLUDE_DEVICE_NAME_IN_ENTITY)
+                    # Find all entities for this device
+                    entities = er.async_entries_for_device(entity_registry, device_id)
                     
-                    # Only update if checkbox is enabled
-                    if current_include_device_name:
-                        # Schedule async update
-                        async def update_entity_names():
-                            # Load translations
-                            translations = await _load_translations(hass)
+                    # Update each entity name
+                    for entity_entry in entities:
+                        # Get translation_key to lookup translated name
+                        translation_key = entity_entry.translation_key
+                        
+                        if translation_key and translations:
+                            # Determine if sensor or binary_sensor
+                            domain = entity_entry.entity_id.split('.')[0]
                             
-                            # Get entity registry
-                            entity_registry = er.async_get(hass)
+                            # Get translated name
+                            entity_trans = translations.get("entity", {}).get(domain, {}).get(translation_key, {})
+                            translated_name = entity_trans.get("name", translation_key.replace('_', ' ').title())
                             
-                            # Find all entities for this device
-                            entities = er.async_entries_for_device(entity_registry, device_id)
+                            # Build new name with updated device label
+                            new_entity_name = f"OKTE - {new_device_name} - {translated_name}"
                             
-                            # Update each entity name
-                            for entity_entry in entities:
-                                # Get translation_key to lookup translated name
-                                translation_key = entity_entry.translation_key
-                                
-                                if translation_key and translations:
-                                    # Determine if sensor or binary_sensor
-                                    domain = entity_entry.entity_id.split('.')[0]
-                                    
-                                    # Get translated name
-                                    entity_trans = translations.get("entity", {}).get(domain, {}).get(translation_key, {})
-                                    translated_name = entity_trans.get("name", translation_key.replace('_', ' ').title())
-                                    
-                                    # Build new name with updated device label
-                                    new_entity_name = f"OKTE - {new_device_name} - {translated_name}"
-                                    
-                                    # Update entity name in registry
-                                    entity_registry.async_update_entity(
-                                        entity_entry.entity_id,
-                                        name=new_entity_name
-                                    )
-                                    
-                                    LOGGER.debug(f"Updated {entity_entry.entity_id} name to: {new_entity_name}")
-                        
-                        # Run async update
-                        hass.async_create_task(update_entity_names())
+                            # Update entity name in registry
+                            entity_registry.async_update_entity(
+                                entity_entry.entity_id,
+                                name=new_entity_name
+                            )
+                            
+                            LOGGER.debug(f"Updated {entity_entry.entity_id} name to: {new_entity_name}")
+                
+                # Run async update
+                hass.async_create_task(update_entity_names())
             
-            entry.async_on_unload(
-                hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
-            )
+        entry.async_on_unload(
+            hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated, event_filter=is_our_device_event)
+        )
         
         # Fallback periodic check - use different intervals for Master and Calculator
         if device_type == DEVICE_TYPE_MASTER:
@@ -455,7 +480,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             else:
                 fallback_interval = DEFAULT_FALLBACK_CHECK_INTERVAL
         else:
-            # Calculator: 30 seconds for faster detector updates
+            # Calculator: 5 minutes - detector transitions are scheduled at window start/end
             if hasattr(instance.settings, 'fallback_check_interval'):
                 fallback_interval = instance.settings.fallback_check_interval
             else:
@@ -16,6 +16,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory, DeviceInfo
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from .const import *
 
@@ -38,7 +39,7 @@ async def _load_translations(hass: HomeAssistant) -> dict:
             if os.path.exists(translations_path):
                 with open(translations_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
-        except:
+        except (OSError, ValueError):
             pass
         return {}
     
@@ -139,7 +140,6 @@ class BinarySensorEntityDefinition(BinarySensorEntity):
             else:
                 # Calculator: "OKTE - {device_label} - {translated_name}"
                 # Get device label from Home Assistant (the name user sets in native HA dialog)
-                from homeassistant.helpers import device_registry as dr
                 device_registry = dr.async_get(self.hass)
                 device_entry = device_registry.async_get_device(identifiers={(DOMAIN, self._entry_id)})
                 
@@ -208,6 +208,9 @@ class BinarySensorEntityDefinition(BinarySensorEntity):
         self._attr_available = available
         self._attr_entity_registry_enabled_default = enabled_by_default
         self._attr_entity_registry_visible_default = enabled_by_default
+        
+        # Last written (available, is_on, name) - used to skip redundant state writes
+        self._last_written_state = None
 
         if device_class is not None:
             self._attr_device_class = device_class
@@ -226,23 +229,13 @@ class BinarySensorEntityDefinition(BinarySensorEntity):
             )
         )
         
-        # Track device registry changes to update entity name immediately when device name changes
-        from homeassistant.helpers.device_registry import async_get as async_get_device_registry, EVENT_DEVICE_REGISTRY_UPDATED
-        from homeassistant.helpers.event import async_track_entity_registry_updated_event
-        
-        @callback
-        def device_registry_updated(event):
-            """Handle device registry update - refresh entity name."""
-            # Check if this event is for our device
-            if event.data.get("device_id"):
-                device_registry = async_get_device_registry(self.hass)
-                device = device_registry.async_get(event.data["device_id"])
-                if device and (DOMAIN, self._entry_id) in device.identifiers:
-                    # Device name changed - update entity state to refresh the name
-                    self.async_write_ha_state()
-        
+        # Refresh entity name when device is updated (single device registry listener in __init__.py)
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_device_update_{self._entry_id}",
+                self.async_write_ha_state,
+            )
         )
 
     @callback
@@ -251,24 +244,26 @@ class BinarySensorEntityDefinition(BinarySensorEntity):
         new_value = self._instance.sensor_states.get(self._entity_id)
         # Check if master is available for Window devices
         if hasattr(self._instance, 'is_master_available'):
-            if not self._instance.is_master_available():
-                self._attr_available = False
-            else:
-                self._attr_available = True
-                if new_value is not None:
-                    self._attr_is_on = new_value
+            self._attr_available = self._instance.is_master_available()
+            if self._attr_available and new_value is not None:
+                self._attr_is_on = new_value
         else:
             # Master device binary sensors (if any in future)
             self._attr_available = True
             if new_value is not None:
                 self._attr_is_on = new_value
         
+        # Skip state write if nothing changed since last write
+        current_state = (self._attr_available, self._attr_is_on, self.name)
+        if current_state == self._last_written_state:
+            return
+        self._last_written_state = current_state
+        
         # Force state update to refresh name from @property
         self.async_write_ha_state()
         
         # Also force entity registry update to refresh displayed name
         try:
-            from homeassistant.helpers import entity_registry as er
             entity_registry = er.async_get(self.hass)
             
             # Get current entity entry
@@ -283,8 +278,3 @@ class BinarySensorEntityDefinition(BinarySensorEntity):
                     )
         except Exception as e:
             LOGGER.debug(f"Could not update entity registry: {e}")
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the binary sensor."""
-        return self._attr_is_on
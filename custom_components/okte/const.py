@@ -200,6 +200,6 @@ ENTITY_HIGHEST_AUTO_TIME_TO = "highest_price_window_to_as_day_end"
 # Default values of static parameters ########################################################################################
 ##############################################################################################################################
 DEFAULT_FALLBACK_CHECK_INTERVAL = 15  # 15 seconds - for Master devices (fast current price updates)
-DEFAULT_FALLBACK_CHECK_INTERVAL_CALCULATOR = 15  # 15 seconds - for Calculator devices (fast detector updates)
+DEFAULT_FALLBACK_CHECK_INTERVAL_CALCULATOR = 300  # 5 minutes - for Calculator devices (safety net only - detectors switch on window start/end timers)
 DEBOUNCE_DELAY = 0.2  # seconds - it groups all changes within this time period (due to better performance)
 CALCULATION_DEBOUNCE_DELAY = 2.0  # seconds - delay for window calculations after config changes (prevents multiple recalculations during value adjustments)
@@ -14,10 +14,16 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
+    MODEL_CALCULATOR,
+    VERSION,
+    DOCUMENTATION_URL,
     CONF_DEVICE_TYPE,
     DEVICE_TYPE_CALCULATOR,
     ENTITY_LOWEST_WINDOW_SIZE,
@@ -102,22 +108,13 @@ class OkteNumberEntity(NumberEntity):
             )
         )
         
-        # Track device registry changes to update entity name immediately when device name changes
-        from homeassistant.helpers.device_registry import async_get as async_get_device_registry, EVENT_DEVICE_REGISTRY_UPDATED
-        
-        @callback
-        def device_registry_updated(event):
-            """Handle device registry update - refresh entity name."""
-            # Check if this event is for our device
-            if event.data.get("device_id"):
-                device_registry = async_get_device_registry(self.hass)
-                device = device_registry.async_get(event.data["device_id"])
-                if device and (DOMAIN, self._entry_id) in device.identifiers:
-                    # Device name changed - update entity state to refresh the name
-                    self.async_write_ha_state()
-        
+        # Refresh entity name when device is updated (single device registry listener in __init__.py)
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_device_update_{self._entry_id}",
+                self.async_write_ha_state,
+            )
         )
     
     @callback
@@ -160,9 +157,6 @@ class OkteNumberEntity(NumberEntity):
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        from .const import MANUFACTURER, MODEL_CALCULATOR, VERSION, DOCUMENTATION_URL
-        from homeassistant.helpers.entity import DeviceInfo
-        
         return DeviceInfo(
             identifiers={(DOMAIN, self._entry_id)},
             name=self.instance.settings.device_name,
@@ -185,7 +179,6 @@ class OkteNumberEntity(NumberEntity):
         # Apply prefix based on checkbox setting
         if self.instance.settings.include_device_name_in_entity:
             # Calculator: "OKTE - {device_label} - {translated_name}"
-            from homeassistant.helpers import device_registry as dr
             device_registry = dr.async_get(self.hass)
             device_entry = device_registry.async_get_device(identifiers={(DOMAIN, self._entry_id)})
             
@@ -13,12 +13,16 @@ import struct
 import dataclasses
 import json
 import asyncio
+import bisect
+import functools
 import time
+from operator import itemgetter
 import urllib.request
 import urllib.error
+import zoneinfo
 
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.core import HomeAssistant, HassJob, callback
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNKNOWN, STATE_UNAVAILABLE, STATE_OK, STATE_PROBLEM
 from .const import *
@@ -46,31 +50,106 @@ PADDING_DATA_ROWS = "1px 7px 1px 7px"
 BG_COLOR_TABLE_DATA_ROW_ODD = "#ffffff"
 BG_COLOR_TABLE_DATA_ROW_EVEN = "#f5f7ff"
 
+# English weekday names (as strftime('%A') in Home Assistant's C locale) - indexed by weekday()
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Static HTML table fragments - formatted once at import
+HTML_TABLE_HEADER_START = f"""
+        <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse; width: 100%; max-width: 400px; border-color: {BORDER_COLOR_HEADER};">
+            <thead>
+                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW1}; color: {TEXT_COLOR_TABLE_HEADER_ROW1};">
+                    <th colspan="2" style="text-align: center; font-size: 16px; padding: {PADDING_HEADER_ROW1};">
+                        """
+HTML_TABLE_HEADER_END = f"""
+                    </th>
+                </tr>
+                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW2}; color: {TEXT_COLOR_TABLE_HEADER_ROW2};">
+                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Čas od - do</th>
+                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Cena [€/MWh]</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+# Data row template - (background color, time range, price color, price)
+HTML_TABLE_ROW = f"""
+                <tr style="background-color: %s;">
+                    <td style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_DATA_ROWS};">%s</td>
+                    <td style="text-align: right; width: auto; max-width: 200px; color: %s; padding: {PADDING_DATA_ROWS};">%.2f €</td>
+                </tr>
+            """
+# Footer template - (date, min price, min from, min to, max price, max from, max to, average price)
+HTML_TABLE_FOOTER = """
+            </tbody>
+            <tfoot>
+                <tr style="background-color: #e8f4f8;">
+                    <td colspan="2" style="padding: 10px; font-size: 14px;">
+                        <strong>📅 Dátum:</strong> %s<br>
+                        <strong>📉 Min. cena:</strong> %.2f € (%s-%s)<br>
+                        <strong>📈 Max. cena:</strong> %.2f € (%s-%s)<br>
+                        <strong>📊 Priemerná cena:</strong> %.2f €
+                    </td>
+                </tr>
+            </tfoot>
+        </table>
+        """
+HTML_TABLE_NO_DATA = f"""
+                <tr>
+                    <td colspan="2" style="text-align: center; height: 200px; vertical-align: middle; border: 1px solid {BORDER_COLOR_DATA};">
+                        Údaje nie sú k dispozícii
+                    </td>
+                </tr>
+            
+            </tbody>
+        </table>
+        """
+
 ##############################################################################################################################
 # API Functions ##############################################################################################################
 ##############################################################################################################################
 
+@functools.lru_cache(maxsize=4)
+def get_zoneinfo(tz_name):
+    """Get ZoneInfo for timezone name (memoized - one object per timezone for the whole integration)."""
+    return zoneinfo.ZoneInfo(tz_name)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_delivery_time(utc_time_str, tz):
+    """Parse UTC time string from API to (local datetime in given ZoneInfo, epoch milliseconds)."""
+    utc_time = datetime.fromisoformat(utc_time_str)
+    return utc_time.astimezone(tz), int(utc_time.timestamp() * 1000)
+
+
+@functools.lru_cache(maxsize=512)
+def _to_local_hhmm(utc_time_str, tz):
+    """Convert UTC time string from API (format: 2024-12-28T23:00:00Z) to local HH:MM in given ZoneInfo."""
+    # fromisoformat accepts the 'Z' suffix directly (Python 3.11+)
+    return datetime.fromisoformat(utc_time_str).astimezone(tz).strftime('%H:%M')
+
+
 def format_local_time(iso_time_str, format_str='%d.%m.%Y %H:%M', hass=None):
     """Format ISO time to local format with timezone conversion."""
     if not iso_time_str:
         return ""
     
+    # Same delivery times are formatted repeatedly - results are memoized per timezone
+    return _format_time(iso_time_str, format_str, hass.config.time_zone if hass else None)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_time(iso_time_str, format_str, ha_timezone):
+    """Format ISO time in given timezone name (or as-is if no timezone)."""
     try:
-        # Parse UTC time from API
-        if iso_time_str.endswith('Z'):
-            utc_time = datetime.fromisoformat(iso_time_str.replace('Z', '+00:00'))
-        else:
-            utc_time = datetime.fromisoformat(iso_time_str)
+        # Parse UTC time from API - fromisoformat accepts the 'Z' suffix (Python 3.11+)
+        utc_time = datetime.fromisoformat(iso_time_str)
         
         # Convert to local timezone if hass is available
-        if hass:
+        if ha_timezone:
             try:
-                import zoneinfo
-                ha_timezone = hass.config.time_zone
-                tz = zoneinfo.ZoneInfo(ha_timezone)
+                tz = get_zoneinfo(ha_timezone)
                 local_time = utc_time.astimezone(tz)
                 return local_time.strftime(format_str)
-            except (ImportError, Exception) as e:
+            except zoneinfo.ZoneInfoNotFoundError as e:
                 LOGGER.debug(f"Could not use Home Assistant timezone, using UTC: {e}")
         
         # Fallback: just format as-is (naive datetime)
@@ -95,17 +174,14 @@ def fetch_okte_data(fetch_days=2, fetch_start_day=None, hass=None):
         list: Array of objects with attributes deliveryStart, period, price
     """
     
-    # Get current local time with timezone
+    # Get current local time with timezone (naive local time if timezone is not known)
+    tz = None
     if hass:
         try:
-            import zoneinfo
-            ha_timezone = hass.config.time_zone
-            tz = zoneinfo.ZoneInfo(ha_timezone)
-            current_local = datetime.now(tz)
-        except (ImportError, Exception):
-            current_local = datetime.now()
-    else:
-        current_local = datetime.now()
+            tz = get_zoneinfo(hass.config.time_zone)
+        except zoneinfo.ZoneInfoNotFoundError as e:
+            LOGGER.debug(f"Could not use Home Assistant timezone, using local time: {e}")
+    current_local = datetime.now(tz)
     
     if fetch_start_day is None:
         start_date = current_local.date()
@@ -147,16 +223,11 @@ def fetch_okte_data(fetch_days=2, fetch_start_day=None, hass=None):
             delivery_start_utc = item.get('deliveryStart')
             delivery_day_local = None
             
-            if delivery_start_utc and hass:
+            if delivery_start_utc and tz:
                 try:
-                    import zoneinfo
-                    ha_timezone = hass.config.time_zone
-                    tz = zoneinfo.ZoneInfo(ha_timezone)
-                    
-                    # Parse UTC time
-                    utc_time = datetime.fromisoformat(delivery_start_utc.replace('Z', '+00:00'))
-                    # Convert to local timezone
-                    local_time = utc_time.astimezone(tz)
+                    # Parse UTC time and convert to local timezone - memoized, so prices attributes
+                    # and price periods reuse this conversion instead of converting the record again
+                    local_time = _parse_delivery_time(delivery_start_utc, tz)[0]
                     # Extract date in local timezone
                     delivery_day_local = local_time.strftime('%Y-%m-%d')
                 except Exception as e:
@@ -227,13 +298,13 @@ def calculate_price_statistics(data):
             'max_record': None
         }
     
-    prices = [record['price'] for record in valid_prices]
-    min_price = min(prices)
-    max_price = max(prices)
-    avg_price = sum(prices) / len(prices)
-    
-    min_record = next(record for record in valid_prices if record['price'] == min_price)
-    max_record = next(record for record in valid_prices if record['price'] == max_price)
+    # Records with min/max price are found directly (first one wins on equal prices)
+    get_price = itemgetter('price')
+    min_record = min(valid_prices, key=get_price)
+    max_record = max(valid_prices, key=get_price)
+    min_price = min_record['price']
+    max_price = max_record['price']
+    avg_price = sum(map(get_price, valid_prices)) / len(valid_prices)
     
     return {
         'min_price': min_price,
@@ -323,36 +394,36 @@ def find_window_cross_days(today_data, tomorrow_data, periods, time_from_str, ti
     best_window = None
     best_avg_price = None
     
+    get_price = itemgetter('price')
     for i in range(len(combined_data) - periods + 1):
         window_records = combined_data[i:i + periods]
         
-        # Calculate window statistics
-        prices = [r['price'] for r in window_records]
-        avg_price = sum(prices) / len(prices)
+        # Calculate window statistics - reduced directly from records, min/max only for a better window
+        avg_price = sum(map(get_price, window_records)) / len(window_records)
         
         # Check if this is better
         if best_window is None:
             best_window = {
                 'records': window_records,
                 'avg_price': avg_price,
-                'min_price': min(prices),
-                'max_price': max(prices)
+                'min_price': min(map(get_price, window_records)),
+                'max_price': max(map(get_price, window_records))
             }
             best_avg_price = avg_price
         elif find_lowest and avg_price < best_avg_price:
             best_window = {
                 'records': window_records,
                 'avg_price': avg_price,
-                'min_price': min(prices),
-                'max_price': max(prices)
+                'min_price': min(map(get_price, window_records)),
+                'max_price': max(map(get_price, window_records))
             }
             best_avg_price = avg_price
         elif not find_lowest and avg_price > best_avg_price:
             best_window = {
                 'records': window_records,
                 'avg_price': avg_price,
-                'min_price': min(prices),
-                'max_price': max(prices)
+                'min_price': min(map(get_price, window_records)),
+                'max_price': max(map(get_price, window_records))
             }
             best_avg_price = avg_price
     
@@ -362,19 +433,14 @@ def find_window_cross_days(today_data, tomorrow_data, periods, time_from_str, ti
         end_record = best_window['records'][-1]
         
         # Parse delivery times
-        start_utc = datetime.fromisoformat(start_record['deliveryStart'].replace('Z', '+00:00'))
-        end_utc = datetime.fromisoformat(end_record['deliveryEnd'].replace('Z', '+00:00'))
+        start_utc = datetime.fromisoformat(start_record['deliveryStart'])
+        end_utc = datetime.fromisoformat(end_record['deliveryEnd'])
         
         # Convert to local timezone
-        try:
-            import zoneinfo
-            ha_timezone = hass.config.time_zone if hass else 'Europe/Bratislava'
-            tz = zoneinfo.ZoneInfo(ha_timezone)
-            start_local = start_utc.astimezone(tz)
-            end_local = end_utc.astimezone(tz)
-        except ImportError:
-            start_local = start_utc + timedelta(hours=1)
-            end_local = end_utc + timedelta(hours=1)
+        ha_timezone = hass.config.time_zone if hass else 'Europe/Bratislava'
+        tz = get_zoneinfo(ha_timezone)
+        start_local = start_utc.astimezone(tz)
+        end_local = end_utc.astimezone(tz)
         
         # Format times
         start_time_with_tz = start_local.isoformat()
@@ -388,11 +454,12 @@ def find_window_cross_days(today_data, tomorrow_data, periods, time_from_str, ti
         formatted_records = []
         for record in best_window['records']:
             try:
-                delivery_start_dt = datetime.fromisoformat(record.get('deliveryStart').replace('Z', '+00:00'))
-                delivery_end_dt = datetime.fromisoformat(record.get('deliveryEnd').replace('Z', '+00:00'))
+                delivery_start_dt = datetime.fromisoformat(record.get('deliveryStart'))
+                delivery_end_dt = datetime.fromisoformat(record.get('deliveryEnd'))
                 period_start_utc = delivery_start_dt.strftime('%H:%M')
                 period_end_utc = delivery_end_dt.strftime('%H:%M')
-            except:
+            except (TypeError, ValueError):
+                # Missing or malformed delivery time - fall back to local period times
                 period_start_utc = record.get('HourStartCET')
                 period_end_utc = record.get('HourEndCET')
             
@@ -510,7 +577,7 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
             period_start_time = datetime.strptime(record['HourStartCET'], '%H:%M').time()
             if time_from <= period_start_time <= time_to:
                 filtered_data.append(record)
-        except:
+        except (TypeError, ValueError):
             continue
     
     if len(filtered_data) < periods:
@@ -528,8 +595,8 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
     
     # Sort by deliveryStart
     try:
-        filtered_data.sort(key=lambda x: x['deliveryStart'])
-    except:
+        filtered_data.sort(key=itemgetter('deliveryStart'))
+    except (KeyError, TypeError):
         return {
             'found': False,
             'message': 'Error sorting data by time',
@@ -544,6 +611,7 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
     
     best_window = None
     best_avg_price = float('inf') if find_lowest else float('-inf')
+    get_price = itemgetter('price')
     
     # Slide window through all possible positions
     for i in range(len(filtered_data) - periods + 1):
@@ -553,21 +621,21 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
         is_continuous = True
         for j in range(len(window_data) - 1):
             try:
-                end_time = datetime.fromisoformat(window_data[j]['deliveryEnd'].replace('Z', '+00:00'))
-                start_time = datetime.fromisoformat(window_data[j + 1]['deliveryStart'].replace('Z', '+00:00'))
+                end_time = datetime.fromisoformat(window_data[j]['deliveryEnd'])
+                start_time = datetime.fromisoformat(window_data[j + 1]['deliveryStart'])
                 if end_time != start_time:
                     is_continuous = False
                     break
-            except:
+            except (KeyError, TypeError, ValueError):
                 is_continuous = False
                 break
         
         if not is_continuous:
             continue
         
-        # Calculate average price in window
-        window_prices = [record['price'] for record in window_data]
-        avg_price = sum(window_prices) / len(window_prices)
+        # Calculate average price in window - reduced directly from records, min/max only for a better window
+        window_total = sum(map(get_price, window_data))
+        avg_price = window_total / len(window_data)
         
         # Check if this window is better
         if (find_lowest and avg_price < best_avg_price) or (not find_lowest and avg_price > best_avg_price):
@@ -576,29 +644,20 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
                 'start_time': window_data[0]['deliveryStart'],
                 'end_time': window_data[-1]['deliveryEnd'],
                 'avg_price': round(avg_price, 2),
-                'min_price': min(window_prices),
-                'max_price': max(window_prices),
+                'min_price': min(map(get_price, window_data)),
+                'max_price': max(map(get_price, window_data)),
                 'records': window_data,
-                'total_cost_per_mwh': round(sum(window_prices), 2)
+                'total_cost_per_mwh': round(window_total, 2)
             }
     
     if best_window:
         # Convert start_time and end_time to datetime with timezone
-        try:
-            import zoneinfo
-            if hass:
-                ha_timezone = hass.config.time_zone
-                tz = zoneinfo.ZoneInfo(ha_timezone)
-            else:
-                tz = zoneinfo.ZoneInfo('Europe/Bratislava')
-        except ImportError:
-            # Fallback for older Python
-            from datetime import timezone, timedelta
-            tz = timezone(timedelta(hours=1))  # CET
+        ha_timezone = hass.config.time_zone if hass else 'Europe/Bratislava'
+        tz = get_zoneinfo(ha_timezone)
         
         # Parse UTC times
-        start_utc = datetime.fromisoformat(best_window['start_time'].replace('Z', '+00:00'))
-        end_utc = datetime.fromisoformat(best_window['end_time'].replace('Z', '+00:00'))
+        start_utc = datetime.fromisoformat(best_window['start_time'])
+        end_utc = datetime.fromisoformat(best_window['end_time'])
         
         # Convert to local timezone
         start_local = start_utc.astimezone(tz)
@@ -617,11 +676,12 @@ def find_window_in_time_range(data, periods, time_from_str, time_to_str, find_lo
         for record in best_window['records']:
             # Parse delivery times to extract UTC hour
             try:
-                delivery_start_dt = datetime.fromisoformat(record.get('deliveryStart').replace('Z', '+00:00'))
-                delivery_end_dt = datetime.fromisoformat(record.get('deliveryEnd').replace('Z', '+00:00'))
+                delivery_start_dt = datetime.fromisoformat(record.get('deliveryStart'))
+                delivery_end_dt = datetime.fromisoformat(record.get('deliveryEnd'))
                 period_start_utc = delivery_start_dt.strftime('%H:%M')
                 period_end_utc = delivery_end_dt.strftime('%H:%M')
-            except:
+            except (TypeError, ValueError):
+                # Missing or malformed delivery time - fall back to local period times
                 period_start_utc = record.get('HourStartCET')
                 period_end_utc = record.get('HourEndCET')
             
@@ -723,6 +783,32 @@ class OKTE_Master_Instance:
         
         # Retry timer for failed API fetch
         self._retry_timer = None
+        
+        # Windows shared by all calculators - valid only for price data from last fetch
+        self._window_cache = {}
+        self._window_cache_fetch_time = None
+        
+        # Rendered HTML tables - {title: (data fingerprint, html)}
+        self._html_table_cache = {}
+        
+        # Prices sensor attributes - {day: (timezone, valid records, attributes)}
+        self._prices_attributes_cache = {}
+        
+        # Cached Home Assistant timezone (ZoneInfo)
+        self._tz = None
+        
+        # Current price is valid until end of its period or until new data is fetched
+        self._current_price_fetch_time = None
+        self._current_price_valid_until = None
+        
+        # Parsed (local start, local end, record) of all records sorted by start - valid for price data from last fetch
+        self._price_periods = []
+        self._price_period_starts = []
+        
+        # Price statistics for today, tomorrow and all data - valid for price data from last fetch
+        self._price_statistics = None
+        self._price_statistics_fetch_time = None
+        self._price_periods_key = None
 
         # Entity IDs
         self.SENSOR_ENTITY_CONNECTION_STATUS = None
@@ -781,99 +867,105 @@ class OKTE_Master_Instance:
             LOGGER.error(f"Error during System Started: {e}")
 
     async def update_current_price(self):
-        """Update only current price from already fetched data - no API call."""
+        """Update only current price from already fetched data - no API call.
+        
+        Returns:
+            bool: False if current price period and data are unchanged (nothing updated)
+        """
         try:
             # Check if we have data
             if not self.price_data.get('all_data'):
                 LOGGER.debug("No data available for current price update")
-                return
+                return True
             
-            data = self.price_data['all_data']
             current_local_time = self._get_current_local_time()
             
-            # Find current price record - match 15-minute intervals
+            # Skip if data was not re-fetched and we are still in the same price period
+            if (self.price_data.get('last_fetch') == self._current_price_fetch_time
+                    and self._current_price_valid_until is not None
+                    and current_local_time < self._current_price_valid_until):
+                return False
+            
+            self._current_price_fetch_time = self.price_data.get('last_fetch')
+            self._current_price_valid_until = None
+            
+            # Find current price record - match 15-minute intervals (binary search on sorted period starts)
             current_record = None
-            for record in data:
-                try:
-                    delivery_start = record.get('deliveryStart')
-                    delivery_end = record.get('deliveryEnd')
-                    if not delivery_start or not delivery_end:
-                        continue
-                    
-                    # Parse UTC times and convert to local
-                    if delivery_start.endswith('Z'):
-                        utc_start = datetime.fromisoformat(delivery_start.replace('Z', '+00:00'))
-                    else:
-                        utc_start = datetime.fromisoformat(delivery_start)
-                    
-                    if delivery_end.endswith('Z'):
-                        utc_end = datetime.fromisoformat(delivery_end.replace('Z', '+00:00'))
-                    else:
-                        utc_end = datetime.fromisoformat(delivery_end)
-                    
-                    # Convert to local timezone
-                    try:
-                        import zoneinfo
-                        ha_timezone = self.hass.config.time_zone
-                        tz = zoneinfo.ZoneInfo(ha_timezone)
-                        local_start = utc_start.astimezone(tz)
-                        local_end = utc_end.astimezone(tz)
-                    except (ImportError, Exception):
-                        local_start = utc_start + timedelta(hours=1)
-                        local_end = utc_end + timedelta(hours=1)
-                    
-                    # Check if current time is within the 15-minute interval
-                    if local_start <= current_local_time < local_end:
-                        current_record = record
-                        LOGGER.debug(f"Current price updated: {record['price']} EUR/MWh for {local_start.strftime('%H:%M')}-{local_end.strftime('%H:%M')}")
-                        break
-                except Exception as e:
-                    continue
+            price_periods = self._get_price_periods()
+            index = bisect.bisect_right(self._price_period_starts, current_local_time.timestamp()) - 1
+            if index >= 0:
+                local_start, local_end, record = price_periods[index]
+                # Check if current time is within the 15-minute interval
+                if current_local_time < local_end:
+                    current_record = record
+                    self._current_price_valid_until = local_end
+                    LOGGER.debug(f"Current price updated: {record.get('price')} EUR/MWh for {local_start.strftime('%H:%M')}-{local_end.strftime('%H:%M')}")
             
             # Update current price sensor
             self.sensor_states[ENTITY_CURRENT_PRICE] = current_record['price'] if current_record else None
             
-            # Update attributes
+            # Update attributes - statistics are computed once per fetch
+            price_statistics = self._get_price_statistics()
+            all_stats = price_statistics['all']
+            
+            attributes = {}
             if current_record:
-                # Get statistics from stored data
-                today_data = self.price_data.get('today_data', [])
-                tomorrow_data = self.price_data.get('tomorrow_data', [])
-                all_data = self.price_data.get('all_data', [])
-                
-                today_stats = calculate_price_statistics(today_data)
-                tomorrow_stats = calculate_price_statistics(tomorrow_data)
-                all_stats = calculate_price_statistics(all_data)
-                
-                self.sensor_attributes[ENTITY_CURRENT_PRICE] = {
-                    'period': current_record.get('period'),
-                    'period_start': format_local_time(current_record.get('deliveryStart'), '%H:%M', self.hass),
-                    'period_end': format_local_time(current_record.get('deliveryEnd'), '%H:%M', self.hass),
-                    'total_records': len(all_data),
-                    'today_average': today_stats['avg_price'],
-                    'tomorrow_average': tomorrow_stats['avg_price'],
-                    'price_spread': round(all_stats['max_price'] - all_stats['min_price'], 2) if all_stats['max_price'] and all_stats['min_price'] else None,
-                }
-            else:
-                # No current record found
-                today_data = self.price_data.get('today_data', [])
-                tomorrow_data = self.price_data.get('tomorrow_data', [])
-                all_data = self.price_data.get('all_data', [])
-                
-                today_stats = calculate_price_statistics(today_data)
-                tomorrow_stats = calculate_price_statistics(tomorrow_data)
-                all_stats = calculate_price_statistics(all_data)
-                
-                self.sensor_attributes[ENTITY_CURRENT_PRICE] = {
-                    'total_records': len(all_data),
-                    'today_average': today_stats['avg_price'],
-                    'tomorrow_average': tomorrow_stats['avg_price'],
-                    'price_spread': round(all_stats['max_price'] - all_stats['min_price'], 2) if all_stats['max_price'] and all_stats['min_price'] else None,
-                }
+                attributes['period'] = current_record.get('period')
+                attributes['period_start'] = current_record.get('HourStartCET')
+                attributes['period_end'] = current_record.get('HourEndCET')
+            attributes['total_records'] = all_stats['total_records']
+            attributes['today_average'] = price_statistics['today']['avg_price']
+            attributes['tomorrow_average'] = price_statistics['tomorrow']['avg_price']
+            attributes['price_spread'] = round(all_stats['max_price'] - all_stats['min_price'], 2) if all_stats['max_price'] and all_stats['min_price'] else None
+            self.sensor_attributes[ENTITY_CURRENT_PRICE] = attributes
             
             LOGGER.debug("OKTE API: Current price sensor updated from cached data")
             
         except Exception as e:
+            self._current_price_valid_until = None
             LOGGER.error(f"OKTE API: Error updating current price: {e}")
+        
+        return True
+
+    def _get_price_periods(self):
+        """Get (local start, local end, record) for all fetched records sorted by start - parsed once per fetch."""
+        tz = self._get_timezone()
+        cache_key = (self.price_data.get('last_fetch'), tz)
+        if cache_key != self._price_periods_key:
+            periods = []
+            for record in self.price_data.get('all_data') or []:
+                delivery_start = record.get('deliveryStart')
+                delivery_end = record.get('deliveryEnd')
+                if not delivery_start or not delivery_end:
+                    continue
+                try:
+                    # Parse UTC times and convert to local (memoized - shared with prices attributes)
+                    local_start = _parse_delivery_time(delivery_start, tz)[0]
+                    local_end = _parse_delivery_time(delivery_end, tz)[0]
+                except ValueError as e:
+                    LOGGER.debug(f"Error parsing delivery time: {e}")
+                    continue
+                periods.append((local_start, local_end, record))
+            periods.sort(key=itemgetter(0))
+            self._price_periods = periods
+            self._price_period_starts = [period[0].timestamp() for period in periods]
+            self._price_periods_key = cache_key
+        return self._price_periods
+
+    def _get_price_statistics(self):
+        """Get price statistics for today, tomorrow and all data - calculated once per fetch."""
+        last_fetch = self.price_data.get('last_fetch')
+        if self._price_statistics is None or last_fetch != self._price_statistics_fetch_time:
+            all_data = self.price_data.get('all_data') or []
+            all_stats = calculate_price_statistics(all_data)
+            all_stats['total_records'] = len(all_data)
+            self._price_statistics = {
+                'today': calculate_price_statistics(self.price_data.get('today_data') or []),
+                'tomorrow': calculate_price_statistics(self.price_data.get('tomorrow_data') or []),
+                'all': all_stats,
+            }
+            self._price_statistics_fetch_time = last_fetch
+        return self._price_statistics
 
     async def fetch_and_process_data(self):
         """Fetch data from API and process it."""
@@ -889,24 +981,38 @@ class OKTE_Master_Instance:
             )
             
             if data:
+                # Read the clock once - reused for fetch time, day filtering and current price
+                current_local_time = self._get_current_local_time()
+                
                 self.price_data['all_data'] = data
-                self.price_data['last_fetch'] = self._get_current_local_time()
+                self.price_data['last_fetch'] = current_local_time
                 
                 # Filter today and tomorrow data - use local timezone
-                current_local_time = self._get_current_local_time()
                 today = current_local_time.date()
                 tomorrow = today + timedelta(days=1)
                 
                 LOGGER.debug(f"OKTE API: Filtering data for today: {today.strftime('%Y-%m-%d')} (local timezone)")
                 
-                self.price_data['today_data'] = filter_data_by_date(data, today)
-                self.price_data['tomorrow_data'] = filter_data_by_date(data, tomorrow)
+                # Single pass over data for both days
+                today_str = today.strftime('%Y-%m-%d')
+                tomorrow_str = tomorrow.strftime('%Y-%m-%d')
+                today_data = []
+                tomorrow_data = []
+                for record in data:
+                    delivery_day = record.get('deliveryDayCET')
+                    if delivery_day == today_str:
+                        today_data.append(record)
+                    elif delivery_day == tomorrow_str:
+                        tomorrow_data.append(record)
+                self.price_data['today_data'] = today_data
+                self.price_data['tomorrow_data'] = tomorrow_data
                 
                 LOGGER.info(f"OKTE API: Successfully fetched {len(data)} records - Today: {len(self.price_data['today_data'])}, Tomorrow: {len(self.price_data['tomorrow_data'])}")
                 
-                # Calculate statistics
-                today_stats = calculate_price_statistics(self.price_data['today_data'])
-                tomorrow_stats = calculate_price_statistics(self.price_data['tomorrow_data'])
+                # Calculate statistics (once per fetch - reused by current price updates)
+                price_statistics = self._get_price_statistics()
+                today_stats = price_statistics['today']
+                tomorrow_stats = price_statistics['tomorrow']
                 
                 # Update sensor states
                 self.sensor_states[ENTITY_CONNECTION_STATUS] = True
@@ -941,33 +1047,8 @@ class OKTE_Master_Instance:
                 self.sensor_states[ENTITY_MAX_PRICE_TODAY] = today_stats['max_price']
                 
                 # Today min/max price attributes
-                if today_stats['min_record']:
-                    min_rec = today_stats['min_record']
-                    self.sensor_attributes[ENTITY_MIN_PRICE_TODAY] = {
-                        'available': True,
-                        'time': format_local_time(min_rec.get('deliveryStart'), '%d.%m.%Y %H:%M', self.hass),
-                        'period': min_rec.get('period'),
-                        'period_start': format_local_time(min_rec.get('deliveryStart'), '%H:%M', self.hass),
-                        'period_end': format_local_time(min_rec.get('deliveryEnd'), '%H:%M', self.hass),
-                    }
-                else:
-                    self.sensor_attributes[ENTITY_MIN_PRICE_TODAY] = {
-                        'available': False,
-                    }
-                
-                if today_stats['max_record']:
-                    max_rec = today_stats['max_record']
-                    self.sensor_attributes[ENTITY_MAX_PRICE_TODAY] = {
-                        'available': True,
-                        'time': format_local_time(max_rec.get('deliveryStart'), '%d.%m.%Y %H:%M', self.hass),
-                        'period': max_rec.get('period'),
-                        'period_start': format_local_time(max_rec.get('deliveryStart'), '%H:%M', self.hass),
-                        'period_end': format_local_time(max_rec.get('deliveryEnd'), '%H:%M', self.hass),
-                    }
-                else:
-                    self.sensor_attributes[ENTITY_MAX_PRICE_TODAY] = {
-                        'available': False,
-                    }
+                self.sensor_attributes[ENTITY_MIN_PRICE_TODAY] = self._get_price_record_attributes(today_stats['min_record'])
+                self.sensor_attributes[ENTITY_MAX_PRICE_TODAY] = self._get_price_record_attributes(today_stats['max_record'])
                 
                 # Tomorrow statistics
                 self.sensor_states[ENTITY_AVERAGE_PRICE_TOMORROW] = tomorrow_stats['avg_price']
@@ -975,76 +1056,35 @@ class OKTE_Master_Instance:
                 self.sensor_states[ENTITY_MAX_PRICE_TOMORROW] = tomorrow_stats['max_price']
                 
                 # Tomorrow min/max price attributes
-                if tomorrow_stats['min_record']:
-                    min_rec = tomorrow_stats['min_record']
-                    self.sensor_attributes[ENTITY_MIN_PRICE_TOMORROW] = {
-                        'available': True,
-                        'time': format_local_time(min_rec.get('deliveryStart'), '%d.%m.%Y %H:%M', self.hass),
-                        'period': min_rec.get('period'),
-                        'period_start': format_local_time(min_rec.get('deliveryStart'), '%H:%M', self.hass),
-                        'period_end': format_local_time(min_rec.get('deliveryEnd'), '%H:%M', self.hass),
-                    }
-                else:
-                    self.sensor_attributes[ENTITY_MIN_PRICE_TOMORROW] = {
-                        'available': False,
-                    }
-                
-                if tomorrow_stats['max_record']:
-                    max_rec = tomorrow_stats['max_record']
-                    self.sensor_attributes[ENTITY_MAX_PRICE_TOMORROW] = {
-                        'available': True,
-                        'time': format_local_time(max_rec.get('deliveryStart'), '%d.%m.%Y %H:%M', self.hass),
-                        'period': max_rec.get('period'),
-                        'period_start': format_local_time(max_rec.get('deliveryStart'), '%H:%M', self.hass),
-                        'period_end': format_local_time(max_rec.get('deliveryEnd'), '%H:%M', self.hass),
-                    }
-                else:
-                    self.sensor_attributes[ENTITY_MAX_PRICE_TOMORROW] = {
-                        'available': False,
-                    }
+                self.sensor_attributes[ENTITY_MIN_PRICE_TOMORROW] = self._get_price_record_attributes(tomorrow_stats['min_record'])
+                self.sensor_attributes[ENTITY_MAX_PRICE_TOMORROW] = self._get_price_record_attributes(tomorrow_stats['max_record'])
                 
                 # Current price - use local timezone
-                current_local_time = self._get_current_local_time()
                 current_hour = current_local_time.replace(minute=0, second=0, microsecond=0)
                 LOGGER.debug(f"Looking for current price at local time: {current_local_time.strftime('%Y-%m-%d %H:%M:%S %Z')}, current_hour: {current_hour.strftime('%H:%M')}")
                 current_record = None
-                for record in data:
-                    try:
-                        # Parse UTC time from API and convert to local timezone
-                        utc_start = datetime.fromisoformat(record['deliveryStart'].replace('Z', '+00:00'))
-                        try:
-                            import zoneinfo
-                            ha_timezone = self.hass.config.time_zone
-                            tz = zoneinfo.ZoneInfo(ha_timezone)
-                            local_start = utc_start.astimezone(tz)
-                        except ImportError:
-                            # Fallback
-                            local_start = utc_start + timedelta(hours=1)
-                        
-                        # Compare hours (ignore minutes/seconds)
-                        local_start_hour = local_start.replace(minute=0, second=0, microsecond=0)
-                        if local_start_hour == current_hour:
-                            current_record = record
-                            LOGGER.debug(f"Found current price: {record['price']} EUR/MWh for time slot {local_start.strftime('%H:%M')}")
-                            break
-                    except Exception as e:
-                        LOGGER.debug(f"Error parsing delivery time: {e}")
-                        continue
+                next_hour = current_hour + timedelta(hours=1)
+                # Delivery times are parsed once per fetch - first period starting within current local hour
+                price_periods = self._get_price_periods()
+                index = bisect.bisect_left(self._price_period_starts, current_hour.timestamp())
+                if index < len(price_periods) and self._price_period_starts[index] < next_hour.timestamp():
+                    local_start, _, current_record = price_periods[index]
+                    LOGGER.debug(f"Found current price: {current_record['price']} EUR/MWh for time slot {local_start.strftime('%H:%M')}")
                 
                 if not current_record:
                     LOGGER.warning(f"No current price found for {current_hour.strftime('%H:%M')}")
                 
                 self.sensor_states[ENTITY_CURRENT_PRICE] = current_record['price'] if current_record else None
                 
-                # Calculate overall statistics for current price attributes
-                all_stats = calculate_price_statistics(data)
+                # Overall statistics for current price attributes
+                all_stats = price_statistics['all']
                 
                 # Current price attributes
                 if current_record:
                     self.sensor_attributes[ENTITY_CURRENT_PRICE] = {
                         'period': current_record.get('period'),
-                        'period_start': format_local_time(current_record.get('deliveryStart'), '%H:%M', self.hass),
-                        'period_end': format_local_time(current_record.get('deliveryEnd'), '%H:%M', self.hass),
+                        'period_start': current_record.get('HourStartCET'),
+                        'period_end': current_record.get('HourEndCET'),
                         'total_records': len(data),
                         'today_average': today_stats['avg_price'],
                         'tomorrow_average': tomorrow_stats['avg_price'],
@@ -1059,145 +1099,47 @@ class OKTE_Master_Instance:
                     }
                 
                 # Prices - create detailed attributes like in original integration
-                # Process TODAY data
-                today_period_data = []
-                today_valid_records = [record for record in self.price_data['today_data'] 
-                                      if record.get('price') is not None and record.get('deliveryStart')]
-                today_valid_records.sort(key=lambda x: x.get('deliveryStart', ''))
+                today_valid_records = self._get_valid_records(self.price_data['today_data'])
+                tomorrow_valid_records = self._get_valid_records(self.price_data['tomorrow_data'])
+                today_count = len(today_valid_records)
+                tomorrow_count = len(tomorrow_valid_records)
                 
-                for record in today_valid_records:
-                    try:
-                        delivery_start = datetime.fromisoformat(record['deliveryStart'].replace('Z', '+00:00'))
-                        
-                        # Convert to local timezone
-                        try:
-                            import zoneinfo
-                            ha_timezone = self.hass.config.time_zone
-                            tz = zoneinfo.ZoneInfo(ha_timezone)
-                            delivery_local = delivery_start.astimezone(tz)
-                        except ImportError:
-                            delivery_local = delivery_start + timedelta(hours=1)
-                        
-                        period_entry = {
-                            'time': record['deliveryStart'],  # ISO format for graphs
-                            'time_local': delivery_local.strftime('%Y-%m-%d %H:%M:%S'),
-                            'price': record['price'],
-                            'period': record.get('period'),
-                            'period_start': record.get('HourStartCET'),
-                            'period_end': record.get('HourEndCET'),
-                            'date': record.get('deliveryDayCET'),
-                            'day_name': delivery_local.strftime('%A'),
-                            'period_label': f"{record.get('HourStartCET', '')}-{record.get('HourEndCET', '')}",
-                            'timestamp': int(delivery_start.timestamp() * 1000)  # For ApexCharts
-                        }
-                        today_period_data.append(period_entry)
-                    except Exception as e:
-                        LOGGER.debug(f"Error processing today hourly record: {e}")
-                        continue
+                self.sensor_states[ENTITY_PRICES_TODAY] = today_count
+                self.sensor_attributes[ENTITY_PRICES_TODAY] = self._get_prices_attributes(today_valid_records, today)
                 
-                today_prices_list = [entry['price'] for entry in today_period_data]
-                today_timestamps_list = [entry['time'] for entry in today_period_data]
-                today_labels_list = [entry['period_label'] for entry in today_period_data]
+                self.sensor_states[ENTITY_PRICES_TOMORROW] = tomorrow_count
+                self.sensor_attributes[ENTITY_PRICES_TOMORROW] = self._get_prices_attributes(tomorrow_valid_records, tomorrow)
                 
-                self.sensor_states[ENTITY_PRICES_TODAY] = len(today_valid_records)
-                self.sensor_attributes[ENTITY_PRICES_TODAY] = {
-                    'period_data': today_period_data,
-                    'periods': len(today_period_data),
-                    'date_range': today.strftime('%Y-%m-%d'),
-                    'prices_list': today_prices_list,
-                    'timestamps_list': today_timestamps_list,
-                    'labels_list': today_labels_list,
-                    'min_price': min(today_prices_list) if today_prices_list else None,
-                    'max_price': max(today_prices_list) if today_prices_list else None,
-                    'avg_price': round(sum(today_prices_list) / len(today_prices_list), 2) if today_prices_list else None
-                }
-                
-                # Process TOMORROW data
-                tomorrow_period_data = []
-                tomorrow_valid_records = [record for record in self.price_data['tomorrow_data']
-                                         if record.get('price') is not None and record.get('deliveryStart')]
-                tomorrow_valid_records.sort(key=lambda x: x.get('deliveryStart', ''))
-                
-                for record in tomorrow_valid_records:
-                    try:
-                        delivery_start = datetime.fromisoformat(record['deliveryStart'].replace('Z', '+00:00'))
-                        
-                        # Convert to local timezone
-                        try:
-                            import zoneinfo
-                            ha_timezone = self.hass.config.time_zone
-                            tz = zoneinfo.ZoneInfo(ha_timezone)
-                            delivery_local = delivery_start.astimezone(tz)
-                        except ImportError:
-                            delivery_local = delivery_start + timedelta(hours=1)
-                        
-                        period_entry = {
-                            'time': record['deliveryStart'],
-                            'time_local': delivery_local.strftime('%Y-%m-%d %H:%M:%S'),
-                            'price': record['price'],
-                            'period': record.get('period'),
-                            'period_start': record.get('HourStartCET'),
-                            'period_end': record.get('HourEndCET'),
-                            'date': record.get('deliveryDayCET'),
-                            'day_name': delivery_local.strftime('%A'),
-                            'period_label': f"{record.get('HourStartCET', '')}-{record.get('HourEndCET', '')}",
-                            'timestamp': int(delivery_start.timestamp() * 1000)
-                        }
-                        tomorrow_period_data.append(period_entry)
-                    except Exception as e:
-                        LOGGER.debug(f"Error processing tomorrow hourly record: {e}")
-                        continue
-                
-                tomorrow_prices_list = [entry['price'] for entry in tomorrow_period_data]
-                tomorrow_timestamps_list = [entry['time'] for entry in tomorrow_period_data]
-                tomorrow_labels_list = [entry['period_label'] for entry in tomorrow_period_data]
-                
-                self.sensor_states[ENTITY_PRICES_TOMORROW] = len(tomorrow_valid_records)
-                self.sensor_attributes[ENTITY_PRICES_TOMORROW] = {
-                    'period_data': tomorrow_period_data,
-                    'periods': len(tomorrow_period_data),
-                    'date_range': tomorrow.strftime('%Y-%m-%d'),
-                    'prices_list': tomorrow_prices_list,
-                    'timestamps_list': tomorrow_timestamps_list,
-                    'labels_list': tomorrow_labels_list,
-                    'min_price': min(tomorrow_prices_list) if tomorrow_prices_list else None,
-                    'max_price': max(tomorrow_prices_list) if tomorrow_prices_list else None,
-                    'avg_price': round(sum(tomorrow_prices_list) / len(tomorrow_prices_list), 2) if tomorrow_prices_list else None
-                }
+                # Keep cached attributes only for days which are still shown
+                for cached_day in [cached_day for cached_day in self._prices_attributes_cache if cached_day not in (today, tomorrow)]:
+                    del self._prices_attributes_cache[cached_day]
                 
-                LOGGER.info(f"Set ENTITY_PRICES_TODAY: {len(today_valid_records)} records in attributes")
-                LOGGER.info(f"Set ENTITY_PRICES_TOMORROW: {len(tomorrow_valid_records)} records in attributes")
+                LOGGER.info(f"Set ENTITY_PRICES_TODAY: {today_count} records in attributes")
+                LOGGER.info(f"Set ENTITY_PRICES_TOMORROW: {tomorrow_count} records in attributes")
                 
                 # HTML tables - pass dates to ensure correct formatting
-                html_today = self.generate_html_table_today(self.price_data['today_data'], today)
-                html_tomorrow = self.generate_html_table_tomorrow(self.price_data['tomorrow_data'], tomorrow)
-                
-                # Count valid records for today
-                today_valid_records = [record for record in self.price_data['today_data'] 
-                                      if record.get('price') is not None and record.get('deliveryStart')]
-                
-                # Count valid records for tomorrow  
-                tomorrow_valid_records = [record for record in self.price_data['tomorrow_data']
-                                         if record.get('price') is not None and record.get('deliveryStart')]
+                # Reuse valid records filtered and sorted above (one filter pass per day per fetch)
+                html_today = self.generate_html_table_today(today_valid_records, today)
+                html_tomorrow = self.generate_html_table_tomorrow(tomorrow_valid_records, tomorrow)
                 
                 # Set state to count of records
-                self.sensor_states[ENTITY_HTML_TABLE_TODAY] = len(today_valid_records)
-                self.sensor_states[ENTITY_HTML_TABLE_TOMORROW] = len(tomorrow_valid_records)
+                self.sensor_states[ENTITY_HTML_TABLE_TODAY] = today_count
+                self.sensor_states[ENTITY_HTML_TABLE_TOMORROW] = tomorrow_count
                 
                 # Set attributes - use local time
                 self.sensor_attributes[ENTITY_HTML_TABLE_TODAY] = {
                     'html_table': html_today,
-                    'total_records': len(today_valid_records),
+                    'total_records': today_count,
                     'date': today.strftime('%d.%m.%Y'),
-                    'available': len(today_valid_records) > 0,
+                    'available': today_count > 0,
                     'last_update': current_local_time.isoformat()
                 }
                 
                 self.sensor_attributes[ENTITY_HTML_TABLE_TOMORROW] = {
                     'html_table': html_tomorrow,
-                    'total_records': len(tomorrow_valid_records),
+                    'total_records': tomorrow_count,
                     'date': tomorrow.strftime('%d.%m.%Y'),
-                    'available': len(tomorrow_valid_records) > 0,
+                    'available': tomorrow_count > 0,
                     'last_update': current_local_time.isoformat()
                 }
                 
@@ -1243,8 +1185,6 @@ class OKTE_Master_Instance:
 
     def _schedule_retry(self):
         """Schedule retry of API fetch in 1 minute if previous attempt failed."""
-        from homeassistant.helpers.event import async_call_later
-        
         # Cancel existing retry timer if any
         if self._retry_timer is not None:
             self._retry_timer()
@@ -1257,12 +1197,116 @@ class OKTE_Master_Instance:
             LOGGER.info("OKTE API: Retrying API fetch after previous failure...")
             await self.fetch_and_process_data()
             # Send update signal
-            from homeassistant.helpers.dispatcher import async_dispatcher_send
             async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
         
         self._retry_timer = async_call_later(self.hass, 60, retry_fetch)
         LOGGER.info("OKTE API: Scheduled retry in 60 seconds")
 
+    def get_window(self, day, periods, time_from_str, time_to_str, find_lowest=True):
+        """Get price window for current price data - calculated once and shared by all calculators."""
+        last_fetch = self.price_data.get('last_fetch')
+        if last_fetch != self._window_cache_fetch_time:
+            self._window_cache = {}
+            self._window_cache_fetch_time = last_fetch
+        
+        # Timezone is part of the key - local window times are rendered in it
+        cache_key = (self._get_timezone(), day, periods, time_from_str, time_to_str, find_lowest)
+        window = self._window_cache.get(cache_key)
+        if window is None:
+            today_data = self.price_data.get('today_data', [])
+            tomorrow_data = self.price_data.get('tomorrow_data', [])
+            if day == 'cross_day':
+                window = find_window_cross_days(today_data, tomorrow_data, periods, time_from_str, time_to_str, find_lowest=find_lowest, hass=self.hass)
+            elif day == 'tomorrow':
+                window = find_window_in_time_range(tomorrow_data, periods, time_from_str, time_to_str, find_lowest=find_lowest, hass=self.hass)
+            else:
+                window = find_window_in_time_range(today_data, periods, time_from_str, time_to_str, find_lowest=find_lowest, hass=self.hass)
+            self._window_cache[cache_key] = window
+        return window
+
+    def _get_price_record_attributes(self, record):
+        """Get min/max price sensor attributes for record - period times are already formatted at fetch."""
+        if not record:
+            return {
+                'available': False,
+            }
+        return {
+            'available': True,
+            'time': format_local_time(record.get('deliveryStart'), '%d.%m.%Y %H:%M', self.hass),
+            'period': record.get('period'),
+            'period_start': record.get('HourStartCET'),
+            'period_end': record.get('HourEndCET'),
+        }
+    
+    def _get_valid_records(self, data):
+        """Return records with price and delivery start, sorted by delivery start."""
+        valid_records = [record for record in data if record.get('price') is not None and record.get('deliveryStart')]
+        valid_records.sort(key=itemgetter('deliveryStart'))
+        return valid_records
+    
+    def _get_prices_attributes(self, valid_records, day):
+        """Get prices sensor attributes of one day - rebuilt only if records of that day changed."""
+        tz = self._get_timezone()
+        cached = self._prices_attributes_cache.get(day)
+        if cached is not None and cached[0] == tz and cached[1] == valid_records:
+            return cached[2]
+        
+        attributes = self._build_prices_attributes(valid_records, day)
+        self._prices_attributes_cache[day] = (tz, valid_records, attributes)
+        return attributes
+    
+    def _build_prices_attributes(self, valid_records, day):
+        """Build detailed period attributes for prices sensor of one day."""
+        period_data = []
+        prices_list = []
+        timestamps_list = []
+        labels_list = []
+        tz = self._get_timezone()
+        
+        for record in valid_records:
+            try:
+                # deliveryStart and price are guaranteed by valid records filter
+                delivery_start_str = record['deliveryStart']
+                price = record['price']
+                get = record.get
+                hour_start = get('HourStartCET')
+                hour_end = get('HourEndCET')
+                period_label = f"{hour_start or ''}-{hour_end or ''}"
+                
+                # Local time and epoch milliseconds - parsed once per delivery time (memoized)
+                delivery_local, timestamp_ms = _parse_delivery_time(delivery_start_str, tz)
+                
+                period_data.append({
+                    'time': delivery_start_str,  # ISO format for graphs
+                    'time_local': delivery_local.strftime('%Y-%m-%d %H:%M:%S'),
+                    'price': price,
+                    'period': get('period'),
+                    'period_start': hour_start,
+                    'period_end': hour_end,
+                    'date': get('deliveryDayCET'),
+                    'day_name': WEEKDAY_NAMES[delivery_local.weekday()],
+                    'period_label': period_label,
+                    'timestamp': timestamp_ms  # For ApexCharts
+                })
+                prices_list.append(price)
+                timestamps_list.append(delivery_start_str)
+                labels_list.append(period_label)
+            except Exception as e:
+                LOGGER.debug(f"Error processing {day} hourly record: {e}")
+                continue
+        
+        return {
+            'period_data': period_data,
+            'periods': len(period_data),
+            'date_range': day.strftime('%Y-%m-%d'),
+            'prices_list': prices_list,
+            'timestamps_list': timestamps_list,
+            'labels_list': labels_list,
+            'min_price': min(prices_list) if prices_list else None,
+            'max_price': max(prices_list) if prices_list else None,
+            'avg_price': round(sum(prices_list) / len(prices_list), 2) if prices_list else None
+        }
+
     def _get_price_color(self, price):
         """Get color for price based on value."""
         if price is None:
@@ -1275,19 +1319,20 @@ class OKTE_Master_Instance:
         else:
             return COLOR_PRICE_NEGATIVE
     
+    def _get_timezone(self):
+        """Get Home Assistant's timezone (ZoneInfo is created only once)."""
+        if self._tz is None:
+            self._tz = get_zoneinfo(self.hass.config.time_zone)
+        return self._tz
+
+    @callback
+    def reset_timezone(self, _event=None):
+        """Forget cached timezone - called when Home Assistant's core configuration changes."""
+        self._tz = None
+    
     def _get_current_local_time(self):
         """Get current time in Home Assistant's timezone."""
-        try:
-            import zoneinfo
-            ha_timezone = self.hass.config.time_zone
-            tz = zoneinfo.ZoneInfo(ha_timezone)
-            return datetime.now(tz)
-        except ImportError:
-            # Fallback - return naive datetime with UTC offset guess
-            from datetime import timezone
-            utc_now = datetime.now(timezone.utc)
-            # Assume CET/CEST (UTC+1/UTC+2) - not ideal but works for most EU
-            return utc_now + timedelta(hours=1)
+        return datetime.now(self._get_timezone())
     
     def _convert_to_local_time(self, utc_time_str):
         """Convert UTC time string to local time string."""
@@ -1295,20 +1340,8 @@ class OKTE_Master_Instance:
             return ""
         
         try:
-            # Parse UTC time from API (format: 2024-12-28T23:00:00Z)
-            utc_time = datetime.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-            
-            # Convert to local timezone
-            try:
-                import zoneinfo
-                ha_timezone = self.hass.config.time_zone
-                tz = zoneinfo.ZoneInfo(ha_timezone)
-                local_time = utc_time.astimezone(tz)
-            except ImportError:
-                # Fallback for older Python versions - assume CET/CEST (UTC+1/UTC+2)
-                local_time = utc_time + timedelta(hours=1)  # CET is UTC+1, CEST is UTC+2
-                
-            return local_time.strftime('%H:%M')
+            # Memoized per (time string, timezone) - same times repeat across tables and footers
+            return _to_local_hhmm(utc_time_str, self._get_timezone())
         except Exception as e:
             LOGGER.debug(f"Error converting time {utc_time_str}: {e}")
             return ""
@@ -1321,116 +1354,7 @@ class OKTE_Master_Instance:
         else:
             today_formatted = self._get_current_local_time().strftime('%d.%m.%Y')
         
-        # Start building HTML table with header (always show)
-        html = f"""
-        <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse; width: 100%; max-width: 400px; border-color: {BORDER_COLOR_HEADER};">
-            <thead>
-                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW1}; color: {TEXT_COLOR_TABLE_HEADER_ROW1};">
-                    <th colspan="2" style="text-align: center; font-size: 16px; padding: {PADDING_HEADER_ROW1};">
-                        Dnešné ceny elektriky OKTE
-                    </th>
-                </tr>
-                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW2}; color: {TEXT_COLOR_TABLE_HEADER_ROW2};">
-                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Čas od - do</th>
-                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Cena [€/MWh]</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        if not data:
-            # No data available - show message
-            html += f"""
-                <tr>
-                    <td colspan="2" style="text-align: center; height: 200px; vertical-align: middle; border: 1px solid {BORDER_COLOR_DATA};">
-                        Údaje nie sú k dispozícii
-                    </td>
-                </tr>
-            """
-            html += """
-            </tbody>
-        </table>
-        """
-            return html
-        
-        # Filter and sort valid records
-        valid_records = [record for record in data if record.get('price') is not None and record.get('deliveryStart')]
-        
-        if not valid_records:
-            # No valid records - show message
-            html += f"""
-                <tr>
-                    <td colspan="2" style="text-align: center; height: 200px; vertical-align: middle; border: 1px solid {BORDER_COLOR_DATA};">
-                        Údaje nie sú k dispozícii
-                    </td>
-                </tr>
-            """
-            html += """
-            </tbody>
-        </table>
-        """
-            return html
-        
-        valid_records.sort(key=lambda x: x.get('deliveryStart', ''))
-        
-        # Calculate statistics
-        prices = [record['price'] for record in valid_records]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
-        
-        min_record = next(record for record in valid_records if record['price'] == min_price)
-        max_record = next(record for record in valid_records if record['price'] == max_price)
-        
-        # Add data rows
-        row_index = 0
-        for record in valid_records:
-            # Convert UTC times to local times
-            time_from = self._convert_to_local_time(record.get('deliveryStart', ''))
-            time_to = self._convert_to_local_time(record.get('deliveryEnd', ''))
-            
-            # Create time range string
-            time_range = f"{time_from} - {time_to}" if time_from and time_to else ""
-            
-            price = record.get('price', 0)
-            
-            # Format price to 2 decimal places with € symbol
-            price_formatted = f"{price:.2f} €"
-            price_color = self._get_price_color(price)
-            
-            # Determine row background color (alternating)
-            row_bg_color = BG_COLOR_TABLE_DATA_ROW_ODD if row_index % 2 == 0 else BG_COLOR_TABLE_DATA_ROW_EVEN
-            
-            html += f"""
-                <tr style="background-color: {row_bg_color};">
-                    <td style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_DATA_ROWS};">{time_range}</td>
-                    <td style="text-align: right; width: auto; max-width: 200px; color: {price_color}; padding: {PADDING_DATA_ROWS};">{price_formatted}</td>
-                </tr>
-            """
-            row_index += 1
-        
-        # Add footer with statistics
-        min_time_from = self._convert_to_local_time(min_record.get('deliveryStart', ''))
-        min_time_to = self._convert_to_local_time(min_record.get('deliveryEnd', ''))
-        max_time_from = self._convert_to_local_time(max_record.get('deliveryStart', ''))
-        max_time_to = self._convert_to_local_time(max_record.get('deliveryEnd', ''))
-        
-        html += f"""
-            </tbody>
-            <tfoot>
-                <tr style="background-color: #e8f4f8;">
-                    <td colspan="2" style="padding: 10px; font-size: 14px;">
-                        <strong>📅 Dátum:</strong> {today_formatted}<br>
-                        <strong>📉 Min. cena:</strong> {min_price:.2f} € ({min_time_from}-{min_time_to})<br>
-                        <strong>📈 Max. cena:</strong> {max_price:.2f} € ({max_time_from}-{max_time_to})<br>
-                        <strong>📊 Priemerná cena:</strong> {avg_price:.2f} €
-                    </td>
-                </tr>
-            </tfoot>
-        </table>
-        """
-        
-        return html
+        return self._generate_html_price_table(data, "Dnešné ceny elektriky OKTE", today_formatted)
     
     def generate_html_table_tomorrow(self, data, date=None):
         """Create HTML table with tomorrow's hourly prices."""
@@ -1441,116 +1365,90 @@ class OKTE_Master_Instance:
             tomorrow = self._get_current_local_time().date() + timedelta(days=1)
             tomorrow_formatted = tomorrow.strftime('%d.%m.%Y')
         
+        return self._generate_html_price_table(data, "Zajtrajšie ceny elektriky OKTE", tomorrow_formatted)
+    
+    def _generate_html_price_table(self, data, title, date_formatted):
+        """Create HTML price table - shared template for today and tomorrow tables."""
+        # Reduce valid records to (start, end, price) rows once - used as cache fingerprint and for rendering
+        # Records are already sorted by delivery start once per fetch (_get_valid_records) - no re-sort here
+        rows = [
+            (record['deliveryStart'], record.get('deliveryEnd', ''), record['price'])
+            for record in data or ()
+            if record.get('price') is not None and record.get('deliveryStart')
+        ]
+        
+        # Re-fetches often return the same prices - reuse the rendered table if nothing changed
+        fingerprint = (date_formatted, self._get_timezone(), rows)
+        cached = self._html_table_cache.get(title)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        html = self._render_html_price_table(rows, title, date_formatted)
+        self._html_table_cache[title] = (fingerprint, html)
+        return html
+    
+    def _render_html_price_table(self, rows, title, date_formatted):
+        """Render HTML price table from sorted (start, end, price) rows."""
         # Start building HTML table with header (always show)
-        html = f"""
-        <table border="1" cellpadding="5" cellspacing="0" style="border-collapse: collapse; width: 100%; max-width: 400px; border-color: {BORDER_COLOR_HEADER};">
-            <thead>
-                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW1}; color: {TEXT_COLOR_TABLE_HEADER_ROW1};">
-                    <th colspan="2" style="text-align: center; font-size: 16px; padding: {PADDING_HEADER_ROW1};">
-                        Zajtrajšie ceny elektriky OKTE
-                    </th>
-                </tr>
-                <tr style="background-color: {BG_COLOR_TABLE_HEADER_ROW2}; color: {TEXT_COLOR_TABLE_HEADER_ROW2};">
-                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Čas od - do</th>
-                    <th style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_HEADER_ROW2};">Cena [€/MWh]</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        if not data:
-            # No data available - show message
-            html += f"""
-                <tr>
-                    <td colspan="2" style="text-align: center; height: 200px; vertical-align: middle; border: 1px solid {BORDER_COLOR_DATA};">
-                        Údaje nie sú k dispozícii
-                    </td>
-                </tr>
-            """
-            html += """
-            </tbody>
-        </table>
-        """
-            return html
-        
-        # Filter and sort valid records
-        valid_records = [record for record in data if record.get('price') is not None and record.get('deliveryStart')]
-        
-        if not valid_records:
-            # No valid records - show message
-            html += f"""
-                <tr>
-                    <td colspan="2" style="text-align: center; height: 200px; vertical-align: middle; border: 1px solid {BORDER_COLOR_DATA};">
-                        Údaje nie sú k dispozícii
-                    </td>
-                </tr>
-            """
-            html += """
-            </tbody>
-        </table>
-        """
-            return html
-        
-        valid_records.sort(key=lambda x: x.get('deliveryStart', ''))
-        
-        # Calculate statistics
-        prices = [record['price'] for record in valid_records]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
-        
-        min_record = next(record for record in valid_records if record['price'] == min_price)
-        max_record = next(record for record in valid_records if record['price'] == max_price)
+        parts = []
+        parts.append(HTML_TABLE_HEADER_START)
+        parts.append(title)
+        parts.append(HTML_TABLE_HEADER_END)
+        
+        if not rows:
+            # No data or no valid records - show message
+            parts.append(HTML_TABLE_NO_DATA)
+            return "".join(parts)
+        
+        # Calculate statistics - single pass for min, max and sum (first row wins on ties)
+        min_row = max_row = rows[0]
+        min_price = max_price = min_row[2]
+        total_price = 0.0
+        for row in rows:
+            price = row[2]
+            total_price += price
+            if price < min_price:
+                min_price = price
+                min_row = row
+            if price > max_price:
+                max_price = price
+                max_row = row
+        avg_price = total_price / len(rows)
+        
+        # Convert UTC times to local times - once per unique time (consecutive periods share boundaries)
+        unique_times = {row[0] for row in rows}
+        unique_times.update(row[1] for row in rows)
+        local_times = {utc_time_str: self._convert_to_local_time(utc_time_str) for utc_time_str in unique_times}
         
         # Add data rows
-        row_index = 0
-        for record in valid_records:
-            # Convert UTC times to local times
-            time_from = self._convert_to_local_time(record.get('deliveryStart', ''))
-            time_to = self._convert_to_local_time(record.get('deliveryEnd', ''))
+        for row_index, row in enumerate(rows):
+            delivery_start, delivery_end, price = row
+            time_from = local_times[delivery_start]
+            time_to = local_times[delivery_end]
             
             # Create time range string
             time_range = f"{time_from} - {time_to}" if time_from and time_to else ""
             
-            price = record.get('price', 0)
-            
-            # Format price to 2 decimal places with € symbol
-            price_formatted = f"{price:.2f} €"
             price_color = self._get_price_color(price)
             
             # Determine row background color (alternating)
             row_bg_color = BG_COLOR_TABLE_DATA_ROW_ODD if row_index % 2 == 0 else BG_COLOR_TABLE_DATA_ROW_EVEN
             
-            html += f"""
-                <tr style="background-color: {row_bg_color};">
-                    <td style="width: auto; max-width: 200px; text-align: center; padding: {PADDING_DATA_ROWS};">{time_range}</td>
-                    <td style="text-align: right; width: auto; max-width: 200px; color: {price_color}; padding: {PADDING_DATA_ROWS};">{price_formatted}</td>
-                </tr>
-            """
-            row_index += 1
+            # Price is formatted to 2 decimal places with € symbol by the template
+            parts.append(HTML_TABLE_ROW % (row_bg_color, time_range, price_color, price))
         
         # Add footer with statistics
-        min_time_from = self._convert_to_local_time(min_record.get('deliveryStart', ''))
-        min_time_to = self._convert_to_local_time(min_record.get('deliveryEnd', ''))
-        max_time_from = self._convert_to_local_time(max_record.get('deliveryStart', ''))
-        max_time_to = self._convert_to_local_time(max_record.get('deliveryEnd', ''))
+        min_time_from, min_time_to = local_times[min_row[0]], local_times[min_row[1]]
+        max_time_from, max_time_to = local_times[max_row[0]], local_times[max_row[1]]
         
-        html += f"""
-            </tbody>
-            <tfoot>
-                <tr style="background-color: #e8f4f8;">
-                    <td colspan="2" style="padding: 10px; font-size: 14px;">
-                        <strong>📅 Dátum:</strong> {tomorrow_formatted}<br>
-                        <strong>📉 Min. cena:</strong> {min_price:.2f} € ({min_time_from}-{min_time_to})<br>
-                        <strong>📈 Max. cena:</strong> {max_price:.2f} € ({max_time_from}-{max_time_to})<br>
-                        <strong>📊 Priemerná cena:</strong> {avg_price:.2f} €
-                    </td>
-                </tr>
-            </tfoot>
-        </table>
-        """
+        parts.append(HTML_TABLE_FOOTER % (
+            date_formatted,
+            min_price, min_time_from, min_time_to,
+            max_price, max_time_from, max_time_to,
+            avg_price,
+        ))
         
-        return html
+        return "".join(parts)
 
     async def my_controller(self):
         """Main controller logic for Master device."""
@@ -1561,18 +1459,20 @@ class OKTE_Master_Instance:
             return
         
         self._is_running = True
+        updated = True
 
         try:
             # Update current price from cached data (no API call)
-            await self.update_current_price()
+            updated = await self.update_current_price()
             
         except Exception as e:
             LOGGER.error(f"OKTE API: Error in master controller: {e}")
             return
 
         finally:
-            # Update all sensors via dispatcher
-            async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
+            # Update all sensors via dispatcher - only if something changed
+            if updated:
+                async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
             self._is_running = False
 
 
@@ -1608,11 +1508,28 @@ class OKTE_Window_Instance:
         
         # Optimization: track when calculations are needed
         self._last_calculation_time = None  # Last time we did full calculation
+        self._detectors_valid_until = None  # Next window edge (epoch seconds) - detector states can't change before it
         self._last_master_fetch_time = None  # Last fetch time from master device
         self._last_config_values = None  # Last configuration values for change detection
         
         # Debounce timer for config changes
         self._debounce_timer = None  # Timer handle for debounced calculation
+        
+        # Cache for calculated windows - windows depend only on master data and configuration
+        self._cached_windows = None  # Last calculated windows
+        self._cached_windows_key = None  # (master fetch time, configuration) used for last calculation
+        self._cached_window_edges = {}  # (start, end) epoch seconds of found cached windows
+        self._cached_window_json = {}  # Serialized found cached windows for sensor states
+        
+        # Timer for next detector transition (start or end of a found window)
+        self._transition_timer = None
+        
+        # Home Assistant's timezone - resolved once on first use
+        self._tz = None
+        
+        # Scheduler jobs - callback type is resolved once here instead of on every scheduling
+        self._calculation_job = HassJob(self._delayed_calculation, "okte delayed calculation")
+        self._transition_job = HassJob(self._transition_reached, "okte detector transition")
 
         # Entity IDs
         self.SENSOR_ENTITY_LOWEST_PRICE_WINDOW = None
@@ -1646,24 +1563,25 @@ class OKTE_Window_Instance:
             self.BINARY_SENSOR_ENTITY_DETECTOR_HIGHEST_PRICE = f"binary_sensor.{ENTITY_PREFIX}_{calculator_number}_{ENTITY_DETECTOR_HIGHEST_PRICE}"
             self.BINARY_SENSOR_ENTITY_DETECTOR_HIGHEST_PRICE_TODAY = f"binary_sensor.{ENTITY_PREFIX}_{calculator_number}_{ENTITY_DETECTOR_HIGHEST_PRICE_TODAY}"
     
+    def _get_timezone(self):
+        """Get Home Assistant's timezone (ZoneInfo is created only once)."""
+        if self._tz is None:
+            self._tz = get_zoneinfo(self.hass.config.time_zone)
+        return self._tz
+
+    @callback
+    def reset_timezone(self, _event=None):
+        """Forget cached timezone - called when Home Assistant's core configuration changes."""
+        self._tz = None
+
     def _get_current_local_time(self):
         """Get current time in Home Assistant's timezone."""
-        try:
-            import zoneinfo
-            ha_timezone = self.hass.config.time_zone
-            tz = zoneinfo.ZoneInfo(ha_timezone)
-            return datetime.now(tz)
-        except ImportError:
-            # Fallback - return naive datetime with UTC offset guess
-            from datetime import timezone
-            utc_now = datetime.now(timezone.utc)
-            # Assume CET/CEST (UTC+1/UTC+2) - not ideal but works for most EU
-            return utc_now + timedelta(hours=1)
+        return datetime.now(self._get_timezone())
 
     @dataclasses.dataclass
     class Settings:
         """Settings for window device."""
-        fallback_check_interval = DEFAULT_FALLBACK_CHECK_INTERVAL
+        fallback_check_interval = DEFAULT_FALLBACK_CHECK_INTERVAL_CALCULATOR
         
         device_name: str = DEFAULT_DEVICE_NAME
         include_device_name_in_entity: bool = DEFAULT_INCLUDE_DEVICE_NAME_IN_ENTITY
@@ -1678,9 +1596,6 @@ class OKTE_Window_Instance:
         Args:
             delay: Delay in seconds. If None, uses CALCULATION_DEBOUNCE_DELAY from const.py
         """
-        from homeassistant.helpers.event import async_call_later
-        from .const import CALCULATION_DEBOUNCE_DELAY
-        
         if delay is None:
             delay = CALCULATION_DEBOUNCE_DELAY
         
@@ -1691,15 +1606,50 @@ class OKTE_Window_Instance:
             LOGGER.debug(f"OKTE Calculation: Cancelled previous debounce timer")
         
         # Schedule new calculation
-        async def delayed_calculation(_now=None):
-            """Execute calculation after debounce delay."""
-            self._debounce_timer = None
-            LOGGER.debug(f"OKTE Calculation: Debounce timer expired, running calculation")
-            await self.my_controller()
-        
-        self._debounce_timer = async_call_later(self.hass, delay, delayed_calculation)
+        self._debounce_timer = async_call_later(self.hass, delay, self._calculation_job)
         LOGGER.debug(f"OKTE Calculation: Scheduled calculation with {delay}s debounce")
 
+    async def _delayed_calculation(self, _now=None):
+        """Execute calculation after debounce delay."""
+        self._debounce_timer = None
+        LOGGER.debug(f"OKTE Calculation: Debounce timer expired, running calculation")
+        await self.my_controller()
+
+    def cancel_transition_timer(self):
+        """Cancel scheduled detector transition, if any."""
+        if self._transition_timer is not None:
+            self._transition_timer()
+            self._transition_timer = None
+
+    def _schedule_next_transition(self, window_edges, now_ts):
+        """Schedule detector update exactly at the next start or end of a found window."""
+        self.cancel_transition_timer()
+        
+        # Collect window edges which are still ahead of us
+        edges = []
+        for key in ('lowest_today', 'highest_today', 'lowest_cross_day', 'highest_cross_day'):
+            for edge in window_edges.get(key, ()):
+                if edge > now_ts:
+                    edges.append(edge)
+        
+        # No upcoming edge - detectors change only with new master data or configuration
+        if not edges:
+            self._detectors_valid_until = None
+            LOGGER.debug("OKTE Calculation: No upcoming window edge, detector transition not scheduled")
+            return
+        
+        self._detectors_valid_until = min(edges)
+        next_edge = datetime.fromtimestamp(self._detectors_valid_until, self._get_timezone())
+        
+        self._transition_timer = async_track_point_in_time(self.hass, self._transition_job, next_edge)
+        LOGGER.debug(f"OKTE Calculation: Scheduled detector transition at {next_edge.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+
+    async def _transition_reached(self, _now=None):
+        """Re-evaluate detectors at window edge."""
+        self._transition_timer = None
+        LOGGER.debug(f"OKTE Calculation: Window edge reached, updating detectors")
+        await self.my_controller(_now)
+
     def system_started(self) -> None:
         """System started callback."""
         try:
@@ -1707,30 +1657,40 @@ class OKTE_Window_Instance:
         except Exception as e:
             LOGGER.error(f"Error during System Started: {e}")
 
-    def get_master_price_data(self):
+    def get_master_instance(self):
+        """Get master device instance."""
+        if not self.settings.master_device:
+            LOGGER.error("Master device not configured")
+            return None
+        
+        # Find master device entry
+        master_entry_id = self.settings.master_device
+        domain_data = self.hass.data.get(DOMAIN, {})  # Looked up once - reused for the entry below
+        LOGGER.debug(f"Looking for master device: {master_entry_id}")
+        LOGGER.debug(f"Available DOMAIN entries: {list(domain_data.keys())}")
+        
+        master_entry = domain_data.get(master_entry_id)
+        if master_entry is not None:
+            master_instance = master_entry.get("instance")
+            if master_instance:
+                return master_instance
+            LOGGER.error(f"Master instance not found in entry {master_entry_id}")
+        else:
+            LOGGER.error(f"Master device {master_entry_id} not found in hass.data")
+        
+        return None
+
+    def get_master_price_data(self, master_instance=None):
         """Get price data from master device."""
         try:
-            if not self.settings.master_device:
-                LOGGER.error("Master device not configured")
-                return None
-            
-            # Find master device entry
-            master_entry_id = self.settings.master_device
-            LOGGER.debug(f"Looking for master device: {master_entry_id}")
-            LOGGER.debug(f"Available DOMAIN entries: {list(self.hass.data.get(DOMAIN, {}).keys())}")
-            
-            if DOMAIN in self.hass.data and master_entry_id in self.hass.data[DOMAIN]:
-                master_instance = self.hass.data[DOMAIN][master_entry_id].get("instance")
-                if master_instance:
-                    price_data = master_instance.price_data
-                    LOGGER.debug(f"Found master price_data with keys: {list(price_data.keys())}")
-                    LOGGER.debug(f"Today data records: {len(price_data.get('today_data', []))}")
-                    LOGGER.debug(f"Tomorrow data records: {len(price_data.get('tomorrow_data', []))}")
-                    return price_data
-                else:
-                    LOGGER.error(f"Master instance not found in entry {master_entry_id}")
-            else:
-                LOGGER.error(f"Master device {master_entry_id} not found in hass.data")
+            if master_instance is None:
+                master_instance = self.get_master_instance()
+            if master_instance:
+                price_data = master_instance.price_data
+                LOGGER.debug(f"Found master price_data with keys: {list(price_data.keys())}")
+                LOGGER.debug(f"Today data records: {len(price_data.get('today_data', []))}")
+                LOGGER.debug(f"Tomorrow data records: {len(price_data.get('tomorrow_data', []))}")
+                return price_data
             
             return None
             
@@ -1745,20 +1705,95 @@ class OKTE_Window_Instance:
                 return False
             
             master_entry_id = self.settings.master_device
-            if DOMAIN in self.hass.data and master_entry_id in self.hass.data[DOMAIN]:
-                return True
-            
-            return False
+            return master_entry_id in self.hass.data.get(DOMAIN, {})
             
         except Exception as e:
             LOGGER.error(f"Error checking master availability: {e}")
             return False
 
-    async def calculate_windows(self):
-        """Calculate time windows from master device data."""
+    def _get_windows(self, master_instance, master_fetch_time, config):
+        """Get lowest/highest price windows, recalculated only when master data or configuration changes."""
+        # Timezone is part of the key - cached window JSON contains local times rendered in it
+        cache_key = (master_fetch_time, self._get_timezone(), dict(config))
+        if self._cached_windows is not None and self._cached_windows_key == cache_key:
+            LOGGER.debug("OKTE Calculation: Using cached windows")
+            return self._cached_windows
+        
+        # Get window settings
+        lowest_window_size = config['lowest_window_size']
+        lowest_time_from = config['lowest_time_from'].strftime("%H:%M")
+        lowest_time_to = config['lowest_time_to'].strftime("%H:%M")
+        
+        highest_window_size = config['highest_window_size']
+        highest_time_from = config['highest_time_from'].strftime("%H:%M")
+        highest_time_to = config['highest_time_to'].strftime("%H:%M")
+        
+        LOGGER.debug(f"OKTE Calculation: Lowest window: size={lowest_window_size}, from={lowest_time_from}, to={lowest_time_to}")
+        LOGGER.debug(f"OKTE Calculation: Highest window: size={highest_window_size}, from={highest_time_from}, to={highest_time_to}")
+        
+        # Windows are calculated by master and shared with other calculators using the same settings
+        windows = {
+            # Lowest price windows
+            'lowest_today': master_instance.get_window('today', lowest_window_size, lowest_time_from, lowest_time_to, find_lowest=True),
+            'lowest_tomorrow': master_instance.get_window('tomorrow', lowest_window_size, lowest_time_from, lowest_time_to, find_lowest=True),
+            # Highest price windows
+            'highest_today': master_instance.get_window('today', highest_window_size, highest_time_from, highest_time_to, find_lowest=False),
+            'highest_tomorrow': master_instance.get_window('tomorrow', highest_window_size, highest_time_from, highest_time_to, find_lowest=False),
+            # Cross-day windows for main sensors (from today time_from to tomorrow time_to)
+            'lowest_cross_day': master_instance.get_window('cross_day', lowest_window_size, lowest_time_from, lowest_time_to, find_lowest=True),
+            'highest_cross_day': master_instance.get_window('cross_day', highest_window_size, highest_time_from, highest_time_to, find_lowest=False),
+        }
+        
+        # Parse window edges once - detectors and transition timer compare plain epoch seconds
+        self._cached_window_edges = {
+            key: (datetime.fromisoformat(window['start_time']).timestamp(), datetime.fromisoformat(window['end_time']).timestamp())
+            for key, window in windows.items() if window['found']
+        }
+        
+        # Serialize windows once - sensor states are reused until windows change
+        self._cached_window_json = {
+            key: json.dumps(window) if window['found'] else None
+            for key, window in windows.items()
+        }
+        
+        self._cached_windows = windows
+        self._cached_windows_key = cache_key
+        return windows
+
+    def _set_sensors_unavailable(self):
+        """Set all window sensors unavailable and all detectors off."""
+        for entity in (ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
+                       ENTITY_HIGHEST_PRICE_WINDOW, ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW):
+            self.sensor_states[entity] = None
+        for entity in (ENTITY_DETECTOR_LOWEST_PRICE, ENTITY_DETECTOR_LOWEST_PRICE_TODAY,
+                       ENTITY_DETECTOR_HIGHEST_PRICE, ENTITY_DETECTOR_HIGHEST_PRICE_TODAY):
+            self.sensor_states[entity] = False
+
+    def _update_detector(self, detector_entity, window_key, now_ts):
+        """Set detector state - on while current time is within the cached window."""
+        edges = self._cached_window_edges.get(window_key)
+        self.sensor_states[detector_entity] = edges is not None and edges[0] <= now_ts < edges[1]
+
+    async def calculate_windows(self, now=None):
+        """Calculate time windows from master device data.
+        
+        Sensors are refreshed by my_controller, which sends a single update signal after each run.
+        
+        Args:
+            now: Time provided by the scheduler. If None, current time is read once here
+        
+        Returns:
+            False if calculation was skipped (sensor states unchanged), otherwise True
+        """
         try:
-            # Get current time
-            current_local_time = self._get_current_local_time()
+            # Get current time - read once and used for both the calculation and the detectors
+            if now is not None:
+                tz = self._get_timezone()
+                # Convert only if scheduler time is not already in local timezone
+                current_local_time = now if now.tzinfo is tz else now.astimezone(tz)
+            else:
+                current_local_time = self._get_current_local_time()
+            now_ts = current_local_time.timestamp()
             current_15min_period = current_local_time.replace(minute=(current_local_time.minute // 15) * 15, second=0, microsecond=0)
             
             # Get current configuration values FIRST (before any returns)
@@ -1774,42 +1809,22 @@ class OKTE_Window_Instance:
             # Check if master is available
             if not self.is_master_available():
                 LOGGER.warning("OKTE Calculation: Master device not available - sensors will be unavailable")
+                self.cancel_transition_timer()
+                self._last_calculation_time = None  # Force full calculation once master data is back
                 # Set all sensors to None to make them unavailable
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TODAY] = None
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TOMORROW] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TODAY] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW] = None
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = False
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = False
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = False
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = False
-                
-                # Send update signal to reflect unavailable state
-                from homeassistant.helpers.dispatcher import async_dispatcher_send
-                async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
-                return
+                self._set_sensors_unavailable()
+                return True
             
-            price_data = self.get_master_price_data()
+            # Resolve master device once - used for price data and shared windows
+            master_instance = self.get_master_instance()
+            price_data = self.get_master_price_data(master_instance)
             if not price_data:
                 LOGGER.warning("OKTE Calculation: No price data available from master device")
+                self.cancel_transition_timer()
+                self._last_calculation_time = None  # Force full calculation once master data is back
                 # Set all sensors to None to make them unavailable
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TODAY] = None
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TOMORROW] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TODAY] = None
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW] = None
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = False
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = False
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = False
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = False
-                
-                # Send update signal to reflect unavailable state
-                from homeassistant.helpers.dispatcher import async_dispatcher_send
-                async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
-                return
+                self._set_sensors_unavailable()
+                return True
             
             # Get master's last fetch time
             master_fetch_time = price_data.get('last_fetch')
@@ -1835,237 +1850,62 @@ class OKTE_Window_Instance:
                 reason.append("configuration changed")
                 self._last_config_values = current_config
             
-            # 15-minute period changed (for detector updates)
-            elif self._last_calculation_time and current_15min_period != self._last_calculation_time:
+            # Window edge reached (for detector updates) - until then detector states can't change
+            elif self._detectors_valid_until is not None and now_ts >= self._detectors_valid_until:
                 need_calculation = True
-                reason.append("15-min period changed")
+                reason.append("window edge reached")
             
             # Skip calculation if not needed
             if not need_calculation:
                 LOGGER.debug(f"OKTE Calculation: Skipping - no changes detected (last calc: {self._last_calculation_time.strftime('%H:%M:%S') if self._last_calculation_time else 'never'})")
-                return
+                return False
             
             # Perform calculation
             LOGGER.info(f"OKTE Calculation: Running window calculations - Reason: {', '.join(reason)}")
             LOGGER.debug(f"OKTE Calculation: Local time: {current_local_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
             
-            today_data = price_data.get('today_data', [])
-            tomorrow_data = price_data.get('tomorrow_data', [])
-            
-            # Get window settings
-            lowest_window_size = current_config['lowest_window_size']
-            lowest_time_from = current_config['lowest_time_from'].strftime("%H:%M")
-            lowest_time_to = current_config['lowest_time_to'].strftime("%H:%M")
-            
-            highest_window_size = current_config['highest_window_size']
-            highest_time_from = current_config['highest_time_from'].strftime("%H:%M")
-            highest_time_to = current_config['highest_time_to'].strftime("%H:%M")
-            
-            LOGGER.debug(f"OKTE Calculation: Lowest window: size={lowest_window_size}, from={lowest_time_from}, to={lowest_time_to}")
-            LOGGER.debug(f"OKTE Calculation: Highest window: size={highest_window_size}, from={highest_time_from}, to={highest_time_to}")
-            
-            # Calculate lowest price windows
-            lowest_today = find_window_in_time_range(
-                today_data, 
-                lowest_window_size, 
-                lowest_time_from, 
-                lowest_time_to, 
-                find_lowest=True,
-                hass=self.hass
-            )
-            
-            lowest_tomorrow = find_window_in_time_range(
-                tomorrow_data, 
-                lowest_window_size, 
-                lowest_time_from, 
-                lowest_time_to, 
-                find_lowest=True,
-                hass=self.hass
-            )
-            
-            # Calculate highest price windows
-            highest_today = find_window_in_time_range(
-                today_data, 
-                highest_window_size, 
-                highest_time_from, 
-                highest_time_to, 
-                find_lowest=False,
-                hass=self.hass
-            )
-            
-            highest_tomorrow = find_window_in_time_range(
-                tomorrow_data, 
-                highest_window_size, 
-                highest_time_from, 
-                highest_time_to, 
-                find_lowest=False,
-                hass=self.hass
-            )
-            
-            # Calculate cross-day windows for main sensors (from today time_from to tomorrow time_to)
-            lowest_cross_day = find_window_cross_days(
-                today_data,
-                tomorrow_data,
-                lowest_window_size,
-                lowest_time_from,
-                lowest_time_to,
-                find_lowest=True,
-                hass=self.hass
-            )
-            
-            highest_cross_day = find_window_cross_days(
-                today_data,
-                tomorrow_data,
-                highest_window_size,
-                highest_time_from,
-                highest_time_to,
-                find_lowest=False,
-                hass=self.hass
-            )
+            # Calculate windows (cached - reused until master data or configuration changes)
+            self._get_windows(master_instance, master_fetch_time, current_config)
             
             # Update sensor states
-            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TODAY] = json.dumps(lowest_today) if lowest_today['found'] else None
-            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TOMORROW] = json.dumps(lowest_tomorrow) if lowest_tomorrow['found'] else None
-            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TODAY] = json.dumps(highest_today) if highest_today['found'] else None
-            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW] = json.dumps(highest_tomorrow) if highest_tomorrow['found'] else None
+            window_json = self._cached_window_json
+            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TODAY] = window_json['lowest_today']
+            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TOMORROW] = window_json['lowest_tomorrow']
+            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TODAY] = window_json['highest_today']
+            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW] = window_json['highest_tomorrow']
             
             # Update detectors - use local timezone for comparison
-            current_local_time = self._get_current_local_time()
-            
-            # Check if current time is within lowest price window today
-            if lowest_today['found']:
-                try:
-                    # Parse UTC times and convert to local timezone
-                    utc_start = datetime.fromisoformat(lowest_today['start_time'].replace('Z', '+00:00'))
-                    utc_end = datetime.fromisoformat(lowest_today['end_time'].replace('Z', '+00:00'))
-                    
-                    try:
-                        import zoneinfo
-                        ha_timezone = self.hass.config.time_zone
-                        tz = zoneinfo.ZoneInfo(ha_timezone)
-                        local_start = utc_start.astimezone(tz)
-                        local_end = utc_end.astimezone(tz)
-                    except ImportError:
-                        local_start = utc_start + timedelta(hours=1)
-                        local_end = utc_end + timedelta(hours=1)
-                    
-                    self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = local_start <= current_local_time < local_end
-                except Exception as e:
-                    LOGGER.debug(f"Error checking lowest price window today: {e}")
-                    self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = False
-            else:
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = False
-            
-            # Check if current time is within highest price window today
-            if highest_today['found']:
-                try:
-                    utc_start = datetime.fromisoformat(highest_today['start_time'].replace('Z', '+00:00'))
-                    utc_end = datetime.fromisoformat(highest_today['end_time'].replace('Z', '+00:00'))
-                    
-                    try:
-                        import zoneinfo
-                        ha_timezone = self.hass.config.time_zone
-                        tz = zoneinfo.ZoneInfo(ha_timezone)
-                        local_start = utc_start.astimezone(tz)
-                        local_end = utc_end.astimezone(tz)
-                    except ImportError:
-                        local_start = utc_start + timedelta(hours=1)
-                        local_end = utc_end + timedelta(hours=1)
-                    
-                    self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = local_start <= current_local_time < local_end
-                except Exception as e:
-                    LOGGER.debug(f"Error checking highest price window today: {e}")
-                    self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = False
-            else:
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = False
+            # Check if current time is within lowest/highest price window today
+            self._update_detector(ENTITY_DETECTOR_LOWEST_PRICE_TODAY, 'lowest_today', now_ts)
+            self._update_detector(ENTITY_DETECTOR_HIGHEST_PRICE_TODAY, 'highest_today', now_ts)
             
             # Update general sensors (without today/tomorrow) - use cross-day windows
             # These search from today time_from to tomorrow time_to
             
             # LOWEST_PRICE_WINDOW - cross-day search result
-            if lowest_cross_day['found']:
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = json.dumps(lowest_cross_day)
-                
-                # Check if current time is within this window for detector
-                try:
-                    utc_start = datetime.fromisoformat(lowest_cross_day['start_time'].replace('Z', '+00:00'))
-                    utc_end = datetime.fromisoformat(lowest_cross_day['end_time'].replace('Z', '+00:00'))
-                    
-                    try:
-                        import zoneinfo
-                        ha_timezone = self.hass.config.time_zone
-                        tz = zoneinfo.ZoneInfo(ha_timezone)
-                        local_start = utc_start.astimezone(tz)
-                        local_end = utc_end.astimezone(tz)
-                    except ImportError:
-                        local_start = utc_start + timedelta(hours=1)
-                        local_end = utc_end + timedelta(hours=1)
-                    
-                    self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = local_start <= current_local_time < local_end
-                except Exception as e:
-                    LOGGER.debug(f"Error checking lowest price window detector: {e}")
-                    self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = False
-            else:
-                self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = False
+            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = window_json['lowest_cross_day']
+            self._update_detector(ENTITY_DETECTOR_LOWEST_PRICE, 'lowest_cross_day', now_ts)
             
             # HIGHEST_PRICE_WINDOW - cross-day search result
-            if highest_cross_day['found']:
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = json.dumps(highest_cross_day)
-                
-                # Check if current time is within this window for detector
-                try:
-                    utc_start = datetime.fromisoformat(highest_cross_day['start_time'].replace('Z', '+00:00'))
-                    utc_end = datetime.fromisoformat(highest_cross_day['end_time'].replace('Z', '+00:00'))
-                    
-                    try:
-                        import zoneinfo
-                        ha_timezone = self.hass.config.time_zone
-                        tz = zoneinfo.ZoneInfo(ha_timezone)
-                        local_start = utc_start.astimezone(tz)
-                        local_end = utc_end.astimezone(tz)
-                    except ImportError:
-                        local_start = utc_start + timedelta(hours=1)
-                        local_end = utc_end + timedelta(hours=1)
-                    
-                    self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = local_start <= current_local_time < local_end
-                except Exception as e:
-                    LOGGER.debug(f"Error checking highest price window detector: {e}")
-                    self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = False
-            else:
-                self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = None
-                self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = False
+            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = window_json['highest_cross_day']
+            self._update_detector(ENTITY_DETECTOR_HIGHEST_PRICE, 'highest_cross_day', now_ts)
             
             # Store calculation time for optimization
             self._last_calculation_time = current_15min_period
             
-            LOGGER.info(f"OKTE Calculation: Window calculations completed successfully")
+            # Schedule next detector update at the nearest window edge
+            self._schedule_next_transition(self._cached_window_edges, now_ts)
             
-            # Send update signal to refresh all sensors with new values
-            from homeassistant.helpers.dispatcher import async_dispatcher_send
-            async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
-            LOGGER.debug(f"OKTE Calculation: Sent update signal to refresh sensors")
+            LOGGER.info(f"OKTE Calculation: Window calculations completed successfully")
+            return True
             
         except Exception as e:
             LOGGER.error(f"OKTE Calculation: Error calculating windows: {e}")
             # On error, set all sensors to unavailable
-            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW] = None
-            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TODAY] = None
-            self.sensor_states[ENTITY_LOWEST_PRICE_WINDOW_TOMORROW] = None
-            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW] = None
-            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TODAY] = None
-            self.sensor_states[ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW] = None
-            self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE] = False
-            self.sensor_states[ENTITY_DETECTOR_LOWEST_PRICE_TODAY] = False
-            self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE] = False
-            self.sensor_states[ENTITY_DETECTOR_HIGHEST_PRICE_TODAY] = False
-            
-            # Send update signal even on error to reflect unavailable state
-            from homeassistant.helpers.dispatcher import async_dispatcher_send
-            async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
-            LOGGER.debug(f"OKTE Calculation: Sent update signal after error")
+            self._set_sensors_unavailable()
+            return True
 
-    async def my_controller(self):
+    async def my_controller(self, now=None):
         """Main controller logic for Window device."""
         LOGGER.debug("OKTE Calculation: Window controller - checking if calculation needed")
         
@@ -2074,16 +1914,18 @@ class OKTE_Window_Instance:
             return
         
         self._is_running = True
+        updated = True
 
         try:
             # Calculate windows (optimized - skips if not needed)
-            await self.calculate_windows()
+            updated = await self.calculate_windows(now)
             
         except Exception as e:
             LOGGER.error(f"OKTE Calculation: Error in window controller: {e}")
             return
 
         finally:
-            # Update all sensors via dispatcher
-            async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
+            # Update all sensors via dispatcher - skipped calculation leaves sensor states unchanged
+            if updated:
+                async_dispatcher_send(self.hass, f"{DOMAIN}_feedback_update_{self._entry_id}")
             self._is_running = False
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import json
+from datetime import datetime, timezone
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
@@ -16,8 +17,10 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory, DeviceInfo
+from homeassistant.helpers import device_registry as dr
 
 from .const import *
+from .okte import get_zoneinfo
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,12 +41,19 @@ async def _load_translations(hass: HomeAssistant) -> dict:
             if os.path.exists(translations_path):
                 with open(translations_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
-        except:
+        except (OSError, ValueError):
             pass
         return {}
     
     return await hass.async_add_executor_job(_load_file)
 
+def _time_range_size(time_from, time_to) -> str:
+    """Return size of time range in H:MM format - computed from times only, no clock read needed."""
+    from_seconds = time_from.hour * 3600 + time_from.minute * 60 + time_from.second
+    to_seconds = time_to.hour * 3600 + time_to.minute * 60 + time_to.second
+    total_minutes = abs(to_seconds - from_seconds) // 60
+    return f"{total_minutes // 60}:{total_minutes % 60:02d}"
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -427,7 +437,6 @@ class SensorEntityDefinition(SensorEntity):
             else:
                 # Calculator: "OKTE - {device_label} - {translated_name}"
                 # Get device label from Home Assistant (the name user sets in native HA dialog)
-                from homeassistant.helpers import device_registry as dr
                 device_registry = dr.async_get(self.hass)
                 device_entry = device_registry.async_get_device(identifiers={(DOMAIN, self._entry_id)})
                 
@@ -508,9 +517,14 @@ class SensorEntityDefinition(SensorEntity):
         self._prices_data = None
         self._html_data = None
         self._window_data = None
+        self._window_info = None  # Parsed _window_data - reused by native_value and extra_state_attributes
+        self._window_attributes = None  # Built window sensor attributes - cleared on every feedback update
         
         # Store attributes configuration
         self._attributes_config = attributes if attributes else {}
+        
+        # Last written (available, value, attributes, name) - used to skip redundant state writes
+        self._last_written_state = None
 
         if device_class is not None:
             self._attr_device_class = device_class
@@ -533,11 +547,10 @@ class SensorEntityDefinition(SensorEntity):
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         
-        # Duration sensors need immediate update with computed values
+        # Duration sensors compute their value in native_value property - initial state is written
+        # by the platform right after this method, so no explicit state write is needed here
         if self._entity_id in [ENTITY_LOWEST_WINDOW_SIZE_TIME, ENTITY_HIGHEST_WINDOW_SIZE_TIME,
                                 ENTITY_LOWEST_SEARCH_WINDOW_SIZE, ENTITY_HIGHEST_SEARCH_WINDOW_SIZE]:
-            # Force initial state update - value will be computed in native_value property
-            self.async_write_ha_state()
             LOGGER.debug(f"Duration sensor {self.entity_id} initialized with computed value")
             # Skip sensor_states initialization for duration sensors
         else:
@@ -556,6 +569,11 @@ class SensorEntityDefinition(SensorEntity):
                 elif self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
                                           ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW]:
                     self._window_data = initial_value
+                    try:
+                        self._window_info = json.loads(initial_value)
+                    except Exception as e:
+                        LOGGER.error(f"Error parsing window JSON for {self.entity_id}: {e}")
+                        self._window_data = None
                     LOGGER.debug(f"Entity {self.entity_id} initialized with window data")
                 # For other sensors - normal value
                 else:
@@ -572,23 +590,13 @@ class SensorEntityDefinition(SensorEntity):
             )
         )
         
-        # Track device registry changes to update entity name immediately when device name changes
-        from homeassistant.helpers.device_registry import async_get as async_get_device_registry, EVENT_DEVICE_REGISTRY_UPDATED
-        from homeassistant.helpers.event import async_track_entity_registry_updated_event
-        
-        @callback
-        def device_registry_updated(event):
-            """Handle device registry update - refresh entity name."""
-            # Check if this event is for our device
-            if event.data.get("device_id"):
-                device_registry = async_get_device_registry(self.hass)
-                device = device_registry.async_get(event.data["device_id"])
-                if device and (DOMAIN, self._entry_id) in device.identifiers:
-                    # Device name changed - update entity state to refresh the name
-                    self.async_write_ha_state()
-        
+        # Refresh entity name when device is updated (single device registry listener in __init__.py)
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_device_update_{self._entry_id}",
+                self.async_write_ha_state,
+            )
         )
 
     @callback
@@ -601,12 +609,15 @@ class SensorEntityDefinition(SensorEntity):
             if self._device_type == DEVICE_TYPE_CALCULATOR:
                 self._attr_available = True
                 # Value is computed in native_value property, no need to set it here
-                self.async_write_ha_state()
+                self._write_state_if_changed()
                 LOGGER.debug(f"Updated duration sensor {self.entity_id}")
             return
         
         new_value = self._instance.sensor_states.get(self._entity_id)
         
+        # Window attributes depend also on configuration - rebuild them on next read
+        self._window_attributes = None
+        
         LOGGER.debug(f"Feedback update for {self.entity_id}: entity_id_key={self._entity_id}, new_value_length={len(str(new_value)) if new_value else 0}")
         
         # For Window device sensors, if value is None, sensor is unavailable
@@ -630,26 +641,30 @@ class SensorEntityDefinition(SensorEntity):
             # For window sensors - store in _window_data
             elif self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
                                       ENTITY_HIGHEST_PRICE_WINDOW, ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW]:
-                self._window_data = new_value
-                if new_value:
-                    try:
-                        import json
-                        data = json.loads(new_value)
-                        if data.get('found'):
-                            LOGGER.debug(f"Updated {self.entity_id} with window data: {data.get('start_time_local')} - {data.get('end_time_local')}, avg: {data.get('avg_price')}")
-                        else:
-                            LOGGER.debug(f"Updated {self.entity_id}: window not found")
-                    except Exception as e:
-                        LOGGER.error(f"Error parsing window JSON for {self.entity_id}: {e}")
-                        self._window_data = None
+                # Same window as last time - already parsed, nothing to do
+                if new_value and new_value == self._window_data and self._window_info is not None:
+                    LOGGER.debug(f"Window data for {self.entity_id} unchanged")
                 else:
-                    self._window_data = None
+                    self._window_data = new_value
+                    self._window_info = None
+                    if new_value:
+                        try:
+                            data = json.loads(new_value)
+                            self._window_info = data
+                            if data.get('found'):
+                                LOGGER.debug(f"Updated {self.entity_id} with window data: {data.get('start_time_local')} - {data.get('end_time_local')}, avg: {data.get('avg_price')}")
+                            else:
+                                LOGGER.debug(f"Updated {self.entity_id}: window not found")
+                        except Exception as e:
+                            LOGGER.error(f"Error parsing window JSON for {self.entity_id}: {e}")
+                            self._window_data = None
+                    else:
+                        self._window_data = None
             
             # For ENTITY_LAST_UPDATE - parse ISO string to datetime
             elif self._entity_id == ENTITY_LAST_UPDATE:
                 if new_value:
                     try:
-                        from datetime import datetime
                         self._attr_native_value = datetime.fromisoformat(new_value)
                         LOGGER.debug(f"Updated {self.entity_id} with timestamp: {self._attr_native_value}")
                     except Exception as e:
@@ -662,142 +677,135 @@ class SensorEntityDefinition(SensorEntity):
             else:
                 self._attr_native_value = new_value
         
-        # Force state update
-        self.async_write_ha_state()
+        # Write state - skipped if nothing changed since last write
+        self._write_state_if_changed()
         
         LOGGER.debug(f"Updated {self.entity_id} complete")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return the state attributes."""
-        # For prices_today and prices_tomorrow - return attributes from sensor_attributes (managed by okte.py)
-        if self._entity_id in [ENTITY_PRICES_TODAY, ENTITY_PRICES_TOMORROW]:
-            return self._instance.sensor_attributes.get(self._entity_id, {})
-        
-        # For HTML tables - return attributes from sensor_attributes (managed by okte.py)
-        elif self._entity_id in [ENTITY_HTML_TABLE_TODAY, ENTITY_HTML_TABLE_TOMORROW]:
-            return self._instance.sensor_attributes.get(self._entity_id, {})
-        
-        # For current price, min/max price sensors - return attributes from sensor_attributes (managed by okte.py)
-        elif self._entity_id in [ENTITY_CURRENT_PRICE, ENTITY_MIN_PRICE_TODAY, ENTITY_MAX_PRICE_TODAY,
-                                  ENTITY_MIN_PRICE_TOMORROW, ENTITY_MAX_PRICE_TOMORROW]:
-            return self._instance.sensor_attributes.get(self._entity_id, {})
-        
-        # For connection status and last update - return attributes from sensor_attributes (managed by okte.py)
-        elif self._entity_id in [ENTITY_CONNECTION_STATUS, ENTITY_LAST_UPDATE]:
-            return self._instance.sensor_attributes.get(self._entity_id, {})
-        
-        # For window sensors - return all window data in attributes
-        elif self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
-                                  ENTITY_HIGHEST_PRICE_WINDOW, ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW]:
-            if hasattr(self, '_window_data') and self._window_data:
-                try:
-                    import json
-                    data = json.loads(self._window_data)
-                    
-                    # Determine if this is lowest or highest window
-                    is_lowest = 'lowest' in self._entity_id
+    @callback
+    def _write_state_if_changed(self) -> None:
+        """Write state only if availability, value, attributes or name changed since last write."""
+        current_state = (self._attr_available, self.native_value, self.extra_state_attributes, self.name)
+        if current_state == self._last_written_state:
+            return
+        self._last_written_state = current_state
+        self.async_write_ha_state()
+
+    def _build_window_attributes(self) -> dict[str, Any]:
+        """Build attributes of window sensor from parsed window data."""
+        if self._window_info is not None:
+            try:
+                data = self._window_info
+                
+                # Determine if this is lowest or highest window
+                is_lowest = 'lowest' in self._entity_id
+                
+                # Calculate window size and search window size
+                if is_lowest:
+                    # Window size from number entity
+                    if hasattr(self._instance, 'number_values'):
+                        periods = self._instance.number_values.get(ENTITY_LOWEST_WINDOW_SIZE, 3)
+                        total_minutes = periods * 15
+                        hours = total_minutes // 60
+                        minutes = total_minutes % 60
+                        window_size_value = f"{hours}:{minutes:02d}"
+                    else:
+                        window_size_value = "0:00"
                     
-                    # Calculate window size and search window size
-                    if is_lowest:
-                        # Window size from number entity
-                        if hasattr(self._instance, 'number_values'):
-                            periods = self._instance.number_values.get(ENTITY_LOWEST_WINDOW_SIZE, 3)
-                            total_minutes = periods * 15
-                            hours = total_minutes // 60
-                            minutes = total_minutes % 60
-                            window_size_value = f"{hours}:{minutes:02d}"
-                        else:
-                            window_size_value = "0:00"
+                    # Search window size from time entities
+                    if hasattr(self._instance, 'time_values'):
+                        time_from = self._instance.time_values.get(ENTITY_LOWEST_TIME_FROM)
+                        time_to = self._instance.time_values.get(ENTITY_LOWEST_TIME_TO)
                         
-                        # Search window size from time entities
-                        if hasattr(self._instance, 'time_values'):
-                            from datetime import datetime
-                            time_from = self._instance.time_values.get(ENTITY_LOWEST_TIME_FROM)
-                            time_to = self._instance.time_values.get(ENTITY_LOWEST_TIME_TO)
-                            
-                            if time_from and time_to:
-                                dt_from = datetime.combine(datetime.today(), time_from)
-                                dt_to = datetime.combine(datetime.today(), time_to)
-                                diff = abs(dt_to - dt_from)
-                                total_minutes = int(diff.total_seconds() / 60)
-                                hours = total_minutes // 60
-                                minutes = total_minutes % 60
-                                search_window_size_value = f"{hours}:{minutes:02d}"
-                            else:
-                                search_window_size_value = "0:00"
+                        if time_from and time_to:
+                            search_window_size_value = _time_range_size(time_from, time_to)
                         else:
                             search_window_size_value = "0:00"
                     else:
-                        # Window size from number entity
-                        if hasattr(self._instance, 'number_values'):
-                            periods = self._instance.number_values.get(ENTITY_HIGHEST_WINDOW_SIZE, 3)
-                            total_minutes = periods * 15
-                            hours = total_minutes // 60
-                            minutes = total_minutes % 60
-                            window_size_value = f"{hours}:{minutes:02d}"
-                        else:
-                            window_size_value = "0:00"
+                        search_window_size_value = "0:00"
+                else:
+                    # Window size from number entity
+                    if hasattr(self._instance, 'number_values'):
+                        periods = self._instance.number_values.get(ENTITY_HIGHEST_WINDOW_SIZE, 3)
+                        total_minutes = periods * 15
+                        hours = total_minutes // 60
+                        minutes = total_minutes % 60
+                        window_size_value = f"{hours}:{minutes:02d}"
+                    else:
+                        window_size_value = "0:00"
+                    
+                    # Search window size from time entities
+                    if hasattr(self._instance, 'time_values'):
+                        time_from = self._instance.time_values.get(ENTITY_HIGHEST_TIME_FROM)
+                        time_to = self._instance.time_values.get(ENTITY_HIGHEST_TIME_TO)
                         
-                        # Search window size from time entities
-                        if hasattr(self._instance, 'time_values'):
-                            from datetime import datetime
-                            time_from = self._instance.time_values.get(ENTITY_HIGHEST_TIME_FROM)
-                            time_to = self._instance.time_values.get(ENTITY_HIGHEST_TIME_TO)
-                            
-                            if time_from and time_to:
-                                dt_from = datetime.combine(datetime.today(), time_from)
-                                dt_to = datetime.combine(datetime.today(), time_to)
-                                diff = abs(dt_to - dt_from)
-                                total_minutes = int(diff.total_seconds() / 60)
-                                hours = total_minutes // 60
-                                minutes = total_minutes % 60
-                                search_window_size_value = f"{hours}:{minutes:02d}"
-                            else:
-                                search_window_size_value = "0:00"
+                        if time_from and time_to:
+                            search_window_size_value = _time_range_size(time_from, time_to)
                         else:
                             search_window_size_value = "0:00"
-                    
-                    if data.get('found'):
-                        return {
-                            "found": True,
-                            "start_time_UTC": data.get('start_time_UTC'),
-                            "end_time_UTC": data.get('end_time_UTC'),
-                            "start_time_local": data.get('start_time_local'),
-                            "end_time_local": data.get('end_time_local'),
-                            "periods": data.get('periods'),
-                            "window_size": window_size_value,
-                            "window_search_size": search_window_size_value,
-                            "min_price": data.get('min_price'),
-                            "max_price": data.get('max_price'),
-                            "avg_price": data.get('avg_price'),
-                            "records": data.get('records', [])
-                        }
                     else:
-                        # Window not found - return structure with null values
-                        return {
-                            "found": False,
-                            "message": data.get('message', 'Window not found'),
-                            "periods": data.get('periods'),
-                            "window_size": window_size_value,
-                            "window_search_size": search_window_size_value,
-                            "min_price": None,
-                            "max_price": None,
-                            "avg_price": None,
-                            "records": []
-                        }
-                except:
-                    return {}
-            # No data available - return structure with null values
-            return {
-                "found": False,
-                "message": "No data available",
-                "periods": None,
-                "min_price": None,
-                "max_price": None,
-                "avg_price": None,
-                "records": []
-            }
+                        search_window_size_value = "0:00"
+                
+                if data.get('found'):
+                    return {
+                        "found": True,
+                        "start_time_UTC": data.get('start_time_UTC'),
+                        "end_time_UTC": data.get('end_time_UTC'),
+                        "start_time_local": data.get('start_time_local'),
+                        "end_time_local": data.get('end_time_local'),
+                        "periods": data.get('periods'),
+                        "window_size": window_size_value,
+                        "window_search_size": search_window_size_value,
+                        "min_price": data.get('min_price'),
+                        "max_price": data.get('max_price'),
+                        "avg_price": data.get('avg_price'),
+                        "records": data.get('records', [])
+                    }
+                else:
+                    # Window not found - return structure with null values
+                    return {
+                        "found": False,
+                        "message": data.get('message', 'Window not found'),
+                        "periods": data.get('periods'),
+                        "window_size": window_size_value,
+                        "window_search_size": search_window_size_value,
+                        "min_price": None,
+                        "max_price": None,
+                        "avg_price": None,
+                        "records": []
+                    }
+            except (AttributeError, TypeError):
+                return {}
+        # No data available - return structure with null values
+        return {
+            "found": False,
+            "message": "No data available",
+            "periods": None,
+            "min_price": None,
+            "max_price": None,
+            "avg_price": None,
+            "records": []
+        }
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        # For prices, HTML tables, current/min/max price, connection status and last update
+        # - return attributes from sensor_attributes (managed by okte.py)
+        if self._entity_id in [ENTITY_PRICES_TODAY, ENTITY_PRICES_TOMORROW,
+                                ENTITY_HTML_TABLE_TODAY, ENTITY_HTML_TABLE_TOMORROW,
+                                ENTITY_CURRENT_PRICE, ENTITY_MIN_PRICE_TODAY, ENTITY_MAX_PRICE_TODAY,
+                                ENTITY_MIN_PRICE_TOMORROW, ENTITY_MAX_PRICE_TOMORROW,
+                                ENTITY_CONNECTION_STATUS, ENTITY_LAST_UPDATE]:
+            return self._instance.sensor_attributes.get(self._entity_id, {})
+        
+        # For window sensors - return all window data in attributes
+        elif self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
+                                  ENTITY_HIGHEST_PRICE_WINDOW, ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW]:
+            # Attributes are built once per window data update and reused on every read
+            if self._window_attributes is None:
+                self._window_attributes = self._build_window_attributes()
+            return self._window_attributes
         
         # For duration sensors - add periods only
         elif self._entity_id in [ENTITY_LOWEST_WINDOW_SIZE_TIME, ENTITY_HIGHEST_WINDOW_SIZE_TIME]:
@@ -825,8 +833,6 @@ class SensorEntityDefinition(SensorEntity):
             is_lowest = self._entity_id == ENTITY_LOWEST_SEARCH_WINDOW_SIZE
             
             if hasattr(self._instance, 'time_values'):
-                from datetime import datetime
-                import zoneinfo
                 
                 # Get times from time entities
                 if is_lowest:
@@ -841,8 +847,7 @@ class SensorEntityDefinition(SensorEntity):
                     try:
                         # Get timezone
                         ha_timezone = self.hass.config.time_zone
-                        tz_local = zoneinfo.ZoneInfo(ha_timezone)
-                        tz_utc = zoneinfo.ZoneInfo('UTC')
+                        tz_local = get_zoneinfo(ha_timezone)
                         
                         # Create datetime objects for today with local timezone
                         today = datetime.now(tz_local).date()
@@ -850,8 +855,8 @@ class SensorEntityDefinition(SensorEntity):
                         dt_to_local = datetime.combine(today, time_to, tzinfo=tz_local)
                         
                         # Convert to UTC
-                        dt_from_utc = dt_from_local.astimezone(tz_utc)
-                        dt_to_utc = dt_to_local.astimezone(tz_utc)
+                        dt_from_utc = dt_from_local.astimezone(timezone.utc)
+                        dt_to_utc = dt_to_local.astimezone(timezone.utc)
                         
                         # Format times
                         attrs["start_time_local"] = dt_from_local.strftime("%H:%M")
@@ -882,85 +887,34 @@ class SensorEntityDefinition(SensorEntity):
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        # For prices sensors - return count as state (set by okte.py)
-        if self._entity_id in [ENTITY_PRICES_TODAY, ENTITY_PRICES_TOMORROW]:
-            return self._attr_native_value
-        
-        # For HTML table sensors - return state directly (count set by okte.py)
-        elif self._entity_id in [ENTITY_HTML_TABLE_TODAY, ENTITY_HTML_TABLE_TOMORROW]:
-            return self._attr_native_value
-        
         # For window sensors - return STATE_WINDOW_FOUND/STATE_WINDOW_NOT_FOUND based on whether window was found
-        elif self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
+        if self._entity_id in [ENTITY_LOWEST_PRICE_WINDOW, ENTITY_LOWEST_PRICE_WINDOW_TODAY, ENTITY_LOWEST_PRICE_WINDOW_TOMORROW,
                                   ENTITY_HIGHEST_PRICE_WINDOW, ENTITY_HIGHEST_PRICE_WINDOW_TODAY, ENTITY_HIGHEST_PRICE_WINDOW_TOMORROW]:
-            if hasattr(self, '_window_data') and self._window_data:
-                try:
-                    import json
-                    data = json.loads(self._window_data)
-                    if data.get('found'):
-                        return STATE_WINDOW_FOUND
-                    return STATE_WINDOW_NOT_FOUND
-                except:
-                    return STATE_WINDOW_NOT_FOUND
+            if self._window_info and self._window_info.get('found'):
+                return STATE_WINDOW_FOUND
             return STATE_WINDOW_NOT_FOUND
         
         # Duration sensors - window size in H:MM format (periods * 15 minutes)
-        elif self._entity_id == ENTITY_LOWEST_WINDOW_SIZE_TIME:
-            if hasattr(self._instance, 'number_values'):
-                periods = self._instance.number_values.get(ENTITY_LOWEST_WINDOW_SIZE, 3)
-                total_minutes = periods * 15
-                hours = total_minutes // 60
-                minutes = total_minutes % 60
-                return f"{hours}:{minutes:02d}"
-            return "0:00"
-        
-        elif self._entity_id == ENTITY_HIGHEST_WINDOW_SIZE_TIME:
+        elif self._entity_id in [ENTITY_LOWEST_WINDOW_SIZE_TIME, ENTITY_HIGHEST_WINDOW_SIZE_TIME]:
             if hasattr(self._instance, 'number_values'):
-                periods = self._instance.number_values.get(ENTITY_HIGHEST_WINDOW_SIZE, 3)
-                total_minutes = periods * 15
-                hours = total_minutes // 60
-                minutes = total_minutes % 60
-                return f"{hours}:{minutes:02d}"
+                size_entity = ENTITY_LOWEST_WINDOW_SIZE if self._entity_id == ENTITY_LOWEST_WINDOW_SIZE_TIME else ENTITY_HIGHEST_WINDOW_SIZE
+                total_minutes = self._instance.number_values.get(size_entity, 3) * 15
+                return f"{total_minutes // 60}:{total_minutes % 60:02d}"
             return "0:00"
         
         # Search window size - time difference between from and to
-        elif self._entity_id == ENTITY_LOWEST_SEARCH_WINDOW_SIZE:
-            if hasattr(self._instance, 'time_values'):
-                from datetime import datetime, timedelta
-                time_from = self._instance.time_values.get(ENTITY_LOWEST_TIME_FROM)
-                time_to = self._instance.time_values.get(ENTITY_LOWEST_TIME_TO)
-                
-                if time_from and time_to:
-                    # Convert times to datetime for calculation
-                    dt_from = datetime.combine(datetime.today(), time_from)
-                    dt_to = datetime.combine(datetime.today(), time_to)
-                    
-                    # Calculate difference (absolute value)
-                    diff = abs(dt_to - dt_from)
-                    total_minutes = int(diff.total_seconds() / 60)
-                    hours = total_minutes // 60
-                    minutes = total_minutes % 60
-                    return f"{hours}:{minutes:02d}"
-            return "0:00"
-        
-        elif self._entity_id == ENTITY_HIGHEST_SEARCH_WINDOW_SIZE:
+        elif self._entity_id in [ENTITY_LOWEST_SEARCH_WINDOW_SIZE, ENTITY_HIGHEST_SEARCH_WINDOW_SIZE]:
             if hasattr(self._instance, 'time_values'):
-                from datetime import datetime, timedelta
-                time_from = self._instance.time_values.get(ENTITY_HIGHEST_TIME_FROM)
-                time_to = self._instance.time_values.get(ENTITY_HIGHEST_TIME_TO)
+                if self._entity_id == ENTITY_LOWEST_SEARCH_WINDOW_SIZE:
+                    time_from = self._instance.time_values.get(ENTITY_LOWEST_TIME_FROM)
+                    time_to = self._instance.time_values.get(ENTITY_LOWEST_TIME_TO)
+                else:
+                    time_from = self._instance.time_values.get(ENTITY_HIGHEST_TIME_FROM)
+                    time_to = self._instance.time_values.get(ENTITY_HIGHEST_TIME_TO)
                 
                 if time_from and time_to:
-                    # Convert times to datetime for calculation
-                    dt_from = datetime.combine(datetime.today(), time_from)
-                    dt_to = datetime.combine(datetime.today(), time_to)
-                    
-                    # Calculate difference (absolute value)
-                    diff = abs(dt_to - dt_from)
-                    total_minutes = int(diff.total_seconds() / 60)
-                    hours = total_minutes // 60
-                    minutes = total_minutes % 60
-                    return f"{hours}:{minutes:02d}"
+                    return _time_range_size(time_from, time_to)
             return "0:00"
         
-        # For all other sensors - return actual value
+        # For all other sensors (prices and HTML table counts included) - return actual value set by okte.py
         return self._attr_native_value
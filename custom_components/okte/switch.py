@@ -9,16 +9,23 @@ from __future__ import annotations
 
 import logging
 from typing import Any
+from datetime import time as dt_time, datetime, timezone
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.const import STATE_ON, STATE_OFF
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
+    MODEL_CALCULATOR,
+    VERSION,
+    DOCUMENTATION_URL,
     DEVICE_TYPE_CALCULATOR,
     CONF_DEVICE_TYPE,
     ENTITY_LOWEST_AUTO_TIME_FROM,
@@ -30,6 +37,7 @@ from .const import (
     ENTITY_HIGHEST_TIME_FROM,
     ENTITY_HIGHEST_TIME_TO,
 )
+from .okte import get_zoneinfo
 
 LOGGER = logging.getLogger(__name__)
 
@@ -132,22 +140,13 @@ class OkteAutoTimeSwitch(SwitchEntity):
         if self._attr_is_on:
             await self._update_time_value()
         
-        # Track device registry changes to update entity name immediately when device name changes
-        from homeassistant.helpers.device_registry import async_get as async_get_device_registry, EVENT_DEVICE_REGISTRY_UPDATED
-        
-        @callback
-        def device_registry_updated(event):
-            """Handle device registry update - refresh entity name."""
-            # Check if this event is for our device
-            if event.data.get("device_id"):
-                device_registry = async_get_device_registry(self.hass)
-                device = device_registry.async_get(event.data["device_id"])
-                if device and (DOMAIN, self._entry_id) in device.identifiers:
-                    # Device name changed - update entity state to refresh the name
-                    self.async_write_ha_state()
-        
+        # Refresh entity name when device is updated (single device registry listener in __init__.py)
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_device_update_{self._entry_id}",
+                self.async_write_ha_state,
+            )
         )
     
     @callback
@@ -220,8 +219,6 @@ class OkteAutoTimeSwitch(SwitchEntity):
     
     async def _update_time_value(self) -> None:
         """Update the time entity value based on sunrise/sunset."""
-        from datetime import time as dt_time
-        
         if not hasattr(self.instance, 'time_values'):
             self.instance.time_values = {}
         
@@ -238,9 +235,6 @@ class OkteAutoTimeSwitch(SwitchEntity):
             return
         
         # Get sunrise or sunset time
-        from datetime import datetime
-        import zoneinfo
-        
         if is_from:
             time_attr = sun_state.attributes.get("next_rising")
         else:
@@ -282,13 +276,10 @@ class OkteAutoTimeSwitch(SwitchEntity):
     def _parse_sun_time(self, time_attr) -> datetime | None:
         """Parse sun time attribute and convert to local datetime."""
         try:
-            from datetime import datetime
-            import zoneinfo
-            
             # Parse datetime
             if isinstance(time_attr, str):
-                # String format - parse it
-                sun_time = datetime.fromisoformat(time_attr.replace('Z', '+00:00'))
+                # String format - parse it (fromisoformat accepts the 'Z' suffix on Python 3.11+)
+                sun_time = datetime.fromisoformat(time_attr)
             elif isinstance(time_attr, datetime):
                 sun_time = time_attr
             else:
@@ -298,11 +289,11 @@ class OkteAutoTimeSwitch(SwitchEntity):
             # Make sure it's timezone aware
             if sun_time.tzinfo is None:
                 # Assume UTC if naive
-                sun_time = sun_time.replace(tzinfo=zoneinfo.ZoneInfo('UTC'))
+                sun_time = sun_time.replace(tzinfo=timezone.utc)
             
             # Convert to local timezone
             ha_timezone = self.hass.config.time_zone
-            tz = zoneinfo.ZoneInfo(ha_timezone)
+            tz = get_zoneinfo(ha_timezone)
             local_time = sun_time.astimezone(tz)
             
             return local_time
@@ -319,9 +310,6 @@ class OkteAutoTimeSwitch(SwitchEntity):
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        from .const import MANUFACTURER, MODEL_CALCULATOR, VERSION, DOCUMENTATION_URL
-        from homeassistant.helpers.entity import DeviceInfo
-        
         return DeviceInfo(
             identifiers={(DOMAIN, self._entry_id)},
             name=self.instance.settings.device_name,
@@ -346,7 +334,6 @@ class OkteAutoTimeSwitch(SwitchEntity):
         # Apply prefix based on checkbox setting
         if self.instance.settings.include_device_name_in_entity:
             # Calculator: "OKTE - {device_label} - {translated_name}"
-            from homeassistant.helpers import device_registry as dr
             device_registry = dr.async_get(self.hass)
             device_entry = device_registry.async_get_device(identifiers={(DOMAIN, self._entry_id)})
             
@@ -9,17 +9,22 @@ from __future__ import annotations
 
 import logging
 from typing import Any
-from datetime import time as dt_time, datetime
-import zoneinfo
+from datetime import time as dt_time, datetime, timezone
 
 from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
+    MODEL_CALCULATOR,
+    VERSION,
+    DOCUMENTATION_URL,
     DEVICE_TYPE_CALCULATOR,
     ENTITY_LOWEST_TIME_FROM,
     ENTITY_LOWEST_TIME_TO,
@@ -30,6 +35,7 @@ from .const import (
     ENTITY_HIGHEST_AUTO_TIME_FROM,
     ENTITY_HIGHEST_AUTO_TIME_TO,
 )
+from .okte import get_zoneinfo
 
 LOGGER = logging.getLogger(__name__)
 
@@ -135,22 +141,13 @@ class OkteTimeEntity(TimeEntity):
         # Initial check for auto mode at startup
         await self._handle_sun_change()
         
-        # Track device registry changes to update entity name immediately when device name changes
-        from homeassistant.helpers.device_registry import async_get as async_get_device_registry, EVENT_DEVICE_REGISTRY_UPDATED
-        
-        @callback
-        def device_registry_updated(event):
-            """Handle device registry update - refresh entity name."""
-            # Check if this event is for our device
-            if event.data.get("device_id"):
-                device_registry = async_get_device_registry(self.hass)
-                device = device_registry.async_get(event.data["device_id"])
-                if device and (DOMAIN, self._entry_id) in device.identifiers:
-                    # Device name changed - update entity state to refresh the name
-                    self.async_write_ha_state()
-        
+        # Refresh entity name when device is updated (single device registry listener in __init__.py)
         self.async_on_remove(
-            self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, device_registry_updated)
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_device_update_{self._entry_id}",
+                self.async_write_ha_state,
+            )
         )
     
     async def _handle_sun_change(self) -> None:
@@ -201,7 +198,6 @@ class OkteTimeEntity(TimeEntity):
             return
         
         # Extract time component and clean it (remove seconds and microseconds)
-        from datetime import time as dt_time
         sun_time_raw = sun_time.time()
         time_value = dt_time(sun_time_raw.hour, sun_time_raw.minute)
         
@@ -227,8 +223,8 @@ class OkteTimeEntity(TimeEntity):
         try:
             # Parse datetime
             if isinstance(time_attr, str):
-                # String format - parse it
-                sun_time = datetime.fromisoformat(time_attr.replace('Z', '+00:00'))
+                # String format - parse it (fromisoformat accepts the 'Z' suffix on Python 3.11+)
+                sun_time = datetime.fromisoformat(time_attr)
             elif isinstance(time_attr, datetime):
                 sun_time = time_attr
             else:
@@ -238,11 +234,11 @@ class OkteTimeEntity(TimeEntity):
             # Make sure it's timezone aware
             if sun_time.tzinfo is None:
                 # Assume UTC if naive
-                sun_time = sun_time.replace(tzinfo=zoneinfo.ZoneInfo('UTC'))
+                sun_time = sun_time.replace(tzinfo=timezone.utc)
             
             # Convert to local timezone
             ha_timezone = self.hass.config.time_zone
-            tz = zoneinfo.ZoneInfo(ha_timezone)
+            tz = get_zoneinfo(ha_timezone)
             local_time = sun_time.astimezone(tz)
             
             return local_time
@@ -285,7 +281,6 @@ class OkteTimeEntity(TimeEntity):
                 )
         
         # Clean the time value - remove seconds and microseconds (keep only HH:MM)
-        from datetime import time as dt_time
         clean_value = dt_time(value.hour, value.minute)
         
         self._attr_native_value = clean_value
@@ -321,9 +316,6 @@ class OkteTimeEntity(TimeEntity):
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        from .const import MANUFACTURER, MODEL_CALCULATOR, VERSION, DOCUMENTATION_URL
-        from homeassistant.helpers.entity import DeviceInfo
-        
         return DeviceInfo(
             identifiers={(DOMAIN, self._entry_id)},
             name=self.instance.settings.device_name,
@@ -348,7 +340,6 @@ class OkteTimeEntity(TimeEntity):
         # Apply prefix based on checkbox setting
         if self.instance.settings.include_device_name_in_entity:
             # Calculator: "OKTE - {device_label} - {translated_name}"
-            from homeassistant.helpers import device_registry as dr
             device_registry = dr.async_get(self.hass)
             device_entry = device_registry.async_get_device(identifiers={(DOMAIN, self._entry_id)})
             